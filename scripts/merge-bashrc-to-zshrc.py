@@ -3,15 +3,147 @@
 Merge .bashrc configuration entries into .zshrc, avoiding duplicates.
 """
 
+import functools
 import os
 import re
 import shutil
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import Iterable, Iterator, List, Set, Tuple
 import argparse
 from datetime import datetime
 
 
+# Start of a function definition, e.g. "function foo" or "foo()"
+_FUNCTION_START_RE = re.compile(r'^\s*function\s+\w+|^\s*\w+\s*\(\s*\)')
+
+# Conditional sourcing guard, e.g. "if [ -f ~/.bash_aliases ]"
+_SOURCE_GUARD_RE = re.compile(r'^\s*if\s+\[\s*-f\s+.*\]')
+
+# Patterns used by ConfigMerger.transform_to_zsh, compiled once
+_SHOPT_RE = re.compile(r'^\s*shopt\s+(-[su])\s+(.+)')
+_PROMPT_COMMAND_RE = re.compile(r'^\s*PROMPT_COMMAND=[\'"](.*)[\'"]')
+_COMPLETE_RE = re.compile(r'^\s*complete\s+.*-F\s+(\S+)\s+(\S+)')
+
+# Map bash shopt options to zsh setopt equivalents
+_SHOPT_TO_SETOPT = {
+    'histappend': 'append_history',
+    'cdspell': 'correct',
+    'nocaseglob': 'no_case_glob',
+    'extglob': 'extended_glob',
+    'dotglob': 'glob_dots',
+    'nullglob': 'null_glob',
+}
+
+# Replace bash-specific variables with zsh equivalents
+_BASH_VAR_REPLACEMENTS = {
+    'BASH_VERSION': 'ZSH_VERSION',
+    'BASH_SOURCE': '${(%):-%x}',  # zsh equivalent for script path
+    'BASHPID': '$$',
+    'BASH_REMATCH': 'match',  # zsh regex capture
+}
+
+# Matches variable references like ${BASH_VERSION} and $BASH_VERSION, so
+# all of them are replaced in one pass over the line
+_BASH_VAR_NAMES = '|'.join(_BASH_VAR_REPLACEMENTS)
+_BASH_VAR_RE = re.compile(
+    rf'\$\{{\s*(?P<braced>{_BASH_VAR_NAMES})\s*\}}|\$(?P<plain>{_BASH_VAR_NAMES})\b'
+)
+
+
+def _replace_bash_var(match: 're.Match[str]') -> str:
+    """Return the zsh replacement for a _BASH_VAR_RE match."""
+    braced = match.group('braced')
+    if braced is None:
+        return _BASH_VAR_REPLACEMENTS[match.group('plain')]
+    zsh_var = _BASH_VAR_REPLACEMENTS[braced]
+    return zsh_var if zsh_var.startswith('$') else f'${{{zsh_var}}}'
+
+
+# Substrings of every line transform_to_zsh changes; lines without any of
+# them are left alone without running the patterns
+_BASH_TOKENS = ('BASH', 'shopt', 'PROMPT_COMMAND', 'complete', 'compgen')
+
+# Bash-only builtins that don't have zsh equivalents
+_BASH_ONLY_BUILTINS = [
+    (builtin, re.compile(rf'^\s*{builtin}\s'))
+    for builtin in ('shopt', 'complete', 'compgen')
+]
+
+
+@functools.lru_cache(maxsize=4096)
+def _transform_line_to_zsh(line: str) -> Tuple[str, ...]:
+    """
+    Transform one line of bash configuration (see ConfigMerger.transform_to_zsh).
+
+    Rc files repeat many lines (blank lines, common exports), so results are cached.
+
+    Args:
+        line: A single line, without its newline
+
+    Returns:
+        The zsh lines replacing it (none, one, or one per shopt option)
+    """
+    stripped = line.strip()
+
+    # Skip empty lines, and lines with nothing to transform
+    if not stripped or not any(token in line for token in _BASH_TOKENS):
+        return (line,)
+
+    # Transform shopt commands to setopt
+    # bash: shopt -s <option>  → zsh: setopt <option>
+    # bash: shopt -u <option>  → zsh: unsetopt <option>
+    shopt_match = _SHOPT_RE.match(line)
+    if shopt_match:
+        flag, options = shopt_match.groups()
+        opt_list = options.split()
+
+        zsh_opts = []
+        for opt in opt_list:
+            zsh_opt = _SHOPT_TO_SETOPT.get(opt, opt)
+            if flag == '-s':
+                zsh_opts.append(f"setopt {zsh_opt}")
+            else:  # -u
+                zsh_opts.append(f"unsetopt {zsh_opt}")
+
+        indent = len(line) - len(line.lstrip())
+        return tuple(' ' * indent + opt for opt in zsh_opts)
+
+    # Transform PROMPT_COMMAND to precmd function
+    # bash: PROMPT_COMMAND='command'  → zsh: precmd() { command }
+    prompt_cmd_match = _PROMPT_COMMAND_RE.match(line)
+    if prompt_cmd_match:
+        command = prompt_cmd_match.group(1)
+        indent = len(line) - len(line.lstrip())
+        return (' ' * indent + f"precmd() {{ {command} }}",)
+
+    # Transform bash completion to zsh completion
+    # bash: complete -F function command  → zsh: compdef function command
+    complete_match = _COMPLETE_RE.match(line)
+    if complete_match:
+        func, cmd = complete_match.groups()
+        indent = len(line) - len(line.lstrip())
+        # Zsh needs completion system loaded
+        return (' ' * indent + f"compdef {func} {cmd}",)
+
+    # Replace bash-specific variables with zsh equivalents
+    transformed_line = _BASH_VAR_RE.sub(_replace_bash_var, line)
+
+    # Comment out bash-only builtins that don't have zsh equivalents
+    for builtin, pattern in _BASH_ONLY_BUILTINS:
+        if pattern.match(stripped):
+            # If not already handled above, comment it out
+            if builtin == 'shopt' and shopt_match:
+                continue  # Already handled
+            if builtin == 'complete' and complete_match:
+                continue  # Already handled
+
+            indent = len(line) - len(line.lstrip())
+            transformed_line = ' ' * indent + f"# [bash-only] {stripped}"
+            break
+
+    return (transformed_line,)
+
+
 class ConfigMerger:
     def __init__(self, bashrc_path: str = None, zshrc_path: str = None, dry_run: bool = False):
         """
@@ -30,6 +162,9 @@ class ConfigMerger:
         # Marker to identify merged content
         self.marker_start = "# --- Merged from .bashrc ---"
         self.marker_end = "# --- End of .bashrc merge ---"
+        # Records, inside the merged section, which .bashrc (resolved path)
+        # and which version of it (mtime_ns) the section came from
+        self.mtime_stamp = "# .bashrc mtime_ns: "
 
     def normalize_line(self, line: str) -> str:
         """Normalize a line for comparison (strip whitespace, ignore comments)."""
@@ -37,7 +172,7 @@ class ConfigMerger:
         normalized = line.strip()
         # Remove inline comments for comparison
         if '#' in normalized and not normalized.startswith('#'):
-            normalized = normalized.split('#')[0].strip()
+            normalized = normalized.partition('#')[0].strip()
         return normalized
 
     def transform_to_zsh(self, entry: str) -> str:
@@ -50,103 +185,13 @@ class ConfigMerger:
         Returns:
             Zsh-compatible configuration entry
         """
-        lines = entry.split('\n')
-        transformed_lines = []
+        # Most entries (exports, aliases, ...) need no changes
+        if not any(token in entry for token in _BASH_TOKENS):
+            return entry
 
-        for line in lines:
-            stripped = line.strip()
-
-            # Skip empty lines
-            if not stripped:
-                transformed_lines.append(line)
-                continue
-
-            # Transform shopt commands to setopt
-            # bash: shopt -s <option>  → zsh: setopt <option>
-            # bash: shopt -u <option>  → zsh: unsetopt <option>
-            shopt_match = re.match(r'^\s*shopt\s+(-[su])\s+(.+)', line)
-            if shopt_match:
-                flag, options = shopt_match.groups()
-                opt_list = options.split()
-
-                # Map bash shopt options to zsh setopt equivalents
-                shopt_to_setopt = {
-                    'histappend': 'append_history',
-                    'cdspell': 'correct',
-                    'nocaseglob': 'no_case_glob',
-                    'extglob': 'extended_glob',
-                    'dotglob': 'glob_dots',
-                    'nullglob': 'null_glob',
-                }
-
-                zsh_opts = []
-                for opt in opt_list:
-                    zsh_opt = shopt_to_setopt.get(opt, opt)
-                    if flag == '-s':
-                        zsh_opts.append(f"setopt {zsh_opt}")
-                    else:  # -u
-                        zsh_opts.append(f"unsetopt {zsh_opt}")
-
-                indent = len(line) - len(line.lstrip())
-                transformed_lines.extend([' ' * indent + opt for opt in zsh_opts])
-                continue
-
-            # Transform PROMPT_COMMAND to precmd function
-            # bash: PROMPT_COMMAND='command'  → zsh: precmd() { command }
-            prompt_cmd_match = re.match(r'^\s*PROMPT_COMMAND=[\'"](.*)[\'"]', line)
-            if prompt_cmd_match:
-                command = prompt_cmd_match.group(1)
-                indent = len(line) - len(line.lstrip())
-                transformed_lines.append(' ' * indent + f"precmd() {{ {command} }}")
-                continue
-
-            # Transform bash completion to zsh completion
-            # bash: complete -F function command  → zsh: compdef function command
-            complete_match = re.match(r'^\s*complete\s+.*-F\s+(\S+)\s+(\S+)', line)
-            if complete_match:
-                func, cmd = complete_match.groups()
-                indent = len(line) - len(line.lstrip())
-                # Zsh needs completion system loaded
-                transformed_lines.append(' ' * indent + f"compdef {func} {cmd}")
-                continue
-
-            # Replace bash-specific variables with zsh equivalents
-            replacements = {
-                'BASH_VERSION': 'ZSH_VERSION',
-                'BASH_SOURCE': '${(%):-%x}',  # zsh equivalent for script path
-                'BASHPID': '$$',
-                'BASH_REMATCH': 'match',  # zsh regex capture
-            }
-
-            transformed_line = line
-            for bash_var, zsh_var in replacements.items():
-                # Match variable references like $BASH_VERSION or ${BASH_VERSION}
-                transformed_line = re.sub(
-                    rf'\${{\s*{bash_var}\s*}}',
-                    zsh_var if zsh_var.startswith('$') else f'${{{zsh_var}}}',
-                    transformed_line
-                )
-                transformed_line = re.sub(
-                    rf'\${bash_var}\b',
-                    zsh_var,
-                    transformed_line
-                )
-
-            # Comment out bash-only builtins that don't have zsh equivalents
-            bash_only_builtins = ['shopt', 'complete', 'compgen']
-            for builtin in bash_only_builtins:
-                if re.match(rf'^\s*{builtin}\s', stripped):
-                    # If not already handled above, comment it out
-                    if builtin == 'shopt' and shopt_match:
-                        continue  # Already handled
-                    if builtin == 'complete' and complete_match:
-                        continue  # Already handled
-
-                    indent = len(line) - len(line.lstrip())
-                    transformed_line = ' ' * indent + f"# [bash-only] {stripped}"
-                    break
-
-            transformed_lines.append(transformed_line)
+        transformed_lines = []
+        for line in entry.split('\n'):
+            transformed_lines.extend(_transform_line_to_zsh(line))
 
         return '\n'.join(transformed_lines)
 
@@ -162,17 +207,11 @@ class ConfigMerger:
         if normalized.startswith('#'):
             return False
 
-        # Skip common boilerplate
-        boilerplate_patterns = [
-            r'^\s*$',  # Empty lines
-            r'^\s*#',  # Comments
-            r'^\s*if\s+\[\s*-f\s+.*\]',  # Conditional sourcing guards
-            r'^\s*fi\s*$',  # End of if
-        ]
-
-        for pattern in boilerplate_patterns:
-            if re.match(pattern, line):
-                return False
+        # Skip common boilerplate: conditional sourcing guards and the end of if
+        if normalized == 'fi':
+            return False
+        if normalized.startswith('if') and _SOURCE_GUARD_RE.match(line):
+            return False
 
         return True
 
@@ -182,18 +221,20 @@ class ConfigMerger:
             return []
 
         with open(file_path, 'r') as f:
-            lines = f.readlines()
+            return list(self.iter_config_entries(f))
 
+    def iter_config_entries(self, lines: Iterable[str]) -> Iterator[str]:
+        """Yield the significant configuration entries among the given lines."""
         # Keep track of multi-line statements
-        config_blocks = []
         current_block = []
         in_function = False
 
         for line in lines:
             stripped = line.strip()
 
-            # Track function definitions (multi-line)
-            if re.match(r'^\s*function\s+\w+|^\s*\w+\s*\(\s*\)', line):
+            # Track function definitions (multi-line); only lines with
+            # "function" or "(" can start one, so most skip the pattern
+            if ('(' in line or 'function' in line) and _FUNCTION_START_RE.match(line):
                 in_function = True
                 current_block = [line]
                 continue
@@ -202,7 +243,7 @@ class ConfigMerger:
                 current_block.append(line)
                 if stripped == '}':
                     in_function = False
-                    config_blocks.append(''.join(current_block))
+                    yield ''.join(current_block)
                     current_block = []
                 continue
 
@@ -217,17 +258,19 @@ class ConfigMerger:
 
             if current_block:
                 current_block.append(line)
-                config_blocks.append(''.join(current_block))
+                yield ''.join(current_block)
                 current_block = []
             else:
-                config_blocks.append(line)
-
-        return config_blocks
+                yield line
 
     def get_existing_configs(self, file_path: Path) -> Set[str]:
         """Get normalized versions of existing configs for duplicate detection."""
-        configs = self.extract_config_entries(file_path)
-        return {self.normalize_line(config) for config in configs}
+        if not file_path.exists():
+            return set()
+
+        # Stream the file rather than holding all of its entries
+        with open(file_path, 'r') as f:
+            return {self.normalize_line(config) for config in self.iter_config_entries(f)}
 
     def find_new_entries(self) -> List[str]:
         """Find entries in .bashrc that don't exist in .zshrc."""
@@ -244,7 +287,7 @@ class ConfigMerger:
 
     def backup_zshrc(self) -> Path:
         """Create a backup of .zshrc."""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
         backup_path = self.zshrc_path.parent / f'.zshrc.backup.{timestamp}'
         shutil.copy2(self.zshrc_path, backup_path)
         return backup_path
@@ -264,6 +307,11 @@ class ConfigMerger:
             if not self.dry_run:
                 self.zshrc_path.touch()
 
+        # Nothing can be new if .bashrc hasn't changed since the last merge
+        bashrc_mtime_ns = self.bashrc_path.stat().st_mtime_ns
+        if self.last_merged_mtime_ns() >= bashrc_mtime_ns:
+            return 0, [], []
+
         # Find new entries
         new_entries = self.find_new_entries()
 
@@ -288,10 +336,32 @@ class ConfigMerger:
                 if not transformed.endswith('\n'):
                     transformed += '\n'
                 f.write(transformed)
+            f.write(f'{self.mtime_stamp}{self.bashrc_path.resolve()} {bashrc_mtime_ns}\n')
             f.write(f'{self.marker_end}\n')
 
         return len(new_entries), new_entries, transformed_entries
 
+    def last_merged_mtime_ns(self) -> int:
+        """Get the mtime of .bashrc recorded when it was last merged into .zshrc (-1 if none)."""
+        try:
+            with open(self.zshrc_path, 'r') as f:
+                content = f.read()
+        except FileNotFoundError:
+            return -1
+
+        # Only a stamp for the same file counts; --bashrc may name another one
+        stamp = f'{self.mtime_stamp}{self.bashrc_path.resolve()} '
+        start = content.rfind(stamp)
+        if start == -1:
+            return -1
+
+        start += len(stamp)
+        end = content.find('\n', start)
+        try:
+            return int(content[start:end if end != -1 else None])
+        except ValueError:
+            return -1
+
     def remove_merged_section(self) -> bool:
         """Remove previously merged section from .zshrc."""
         if not self.zshrc_path.exists():
@@ -7,10 +7,13 @@ Now includes themes from eza-community/eza-themes collection!
 
 VERSION = "1.1.0"
 
+import functools
+import itertools
 import os
+import re
 import sys
 import shutil
-import subprocess
+import time
 import unicodedata
 from pathlib import Path
 from datetime import datetime
@@ -40,6 +43,78 @@ class Theme:
     # Additional colors for preview
     color_swatches: Dict[str, str]  # name -> hex
 
+    @functools.cached_property
+    def swatch_lines(self) -> Tuple[Tuple[str, str, bool], ...]:
+        """Preformatted (label, hex color, dimmable) rows for the palette preview"""
+        return tuple(
+            (f" {name:12} {hex_color}", hex_color, name.upper() in ('BG', 'BORDER'))
+            for name, hex_color in self.color_swatches.items()
+        )
+
+    @functools.cached_property
+    def tmux_block(self) -> str:
+        """Theme block appended to tmux.conf"""
+        return f"""
+# ========================================
+# Theme: {self.name}
+# ========================================
+
+# Status bar colors
+set -g status-style bg={self.bg_color},fg={self.fg_color}
+set -g status-left-style bg={self.bg_color},fg={self.accent_color}
+set -g status-right-style bg={self.bg_color},fg={self.fg_color}
+
+# Pane border colors
+set -g pane-border-style fg={self.border_color}
+set -g pane-active-border-style fg={self.border_active}
+
+# Window status colors
+setw -g window-status-style fg={self.fg_color},bg={self.bg_color}
+setw -g window-status-current-style fg={self.bg_color},bg={self.accent_color},bold
+
+# Message colors
+set -g message-style bg={self.message_bg},fg={self.message_fg},bold
+set -g message-command-style bg={self.message_bg},fg={self.message_fg},bold
+
+# Activity color
+setw -g window-status-activity-style fg={self.activity_color},bg={self.bg_color}
+
+# ========================================
+"""
+
+    @functools.cached_property
+    def shell_block(self) -> str:
+        """Theme block appended to the shell rc file"""
+        return f"""
+# ======================================== TMUX THEME COLORS
+# Auto-generated by tmux-theme-switcher.py
+# Theme: {self.name}
+# ========================================
+
+# EZA color configuration (for directory colors)
+export EZA_COLORS="di={self.dir_color}:ln=01;36:so=01;35:pi=40;33:ex={self.dir_color}:bd=40;33;01:cd=40;33;01:su=37;41:sg=30;43:tw=30;42:ow={self.dir_color}:uu={self.dir_color}:gu={self.dir_color}"
+
+# Traditional LS_COLORS (fallback for standard ls command)
+export LS_COLORS="di={self.dir_color}:ln=01;36:so=01;35:pi=40;33:ex={self.dir_color}:bd=40;33;01:cd=40;33;01:su=37;41:sg=30;43:tw=30;42:ow={self.dir_color}"
+
+# Bat theme (syntax highlighting)
+export BAT_THEME="{self.bat_theme}"
+
+# FZF colors (matching theme)
+export FZF_DEFAULT_OPTS="--color=fg:-1,bg:-1,hl:{self.dir_color},fg+:#ffffff,bg+:#3a3a3a,hl+:{self.dir_color} --color=info:{self.dir_color},prompt:{self.dir_color},pointer:{self.dir_color},marker:{self.dir_color},spinner:{self.dir_color}"
+
+# PS1 Configuration
+export PS1="{self.ps1_color}\\u\\[\\033[00m\\]@\\h:\\[\\033[01;34m\\]\\w\\[\\033[00m\\]\\$ "
+
+# Alias ll to eza -l
+alias ll='eza -l'
+
+# Alias llt to eza -l -T --level 2 -a
+alias llt='eza -l -T --level 2 -a'
+
+# ======================================== END TMUX THEME COLORS
+"""
+
 
 # Theme Database - Categorized by primary color
 THEMES = {
@@ -825,6 +900,7 @@ def get_display_width(text: str) -> int:
     return width
 
 
+@functools.lru_cache(maxsize=1024)
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     """Convert hex color to RGB tuple"""
     hex_color = hex_color.lstrip('#')
@@ -836,6 +912,140 @@ def rgb_to_curses(r: int, g: int, b: int) -> Tuple[int, int, int]:
     return int(r * 1000 / 255), int(g * 1000 / 255), int(b * 1000 / 255)
 
 
+def addstr_runs(win, row: int, col: int, runs):
+    """Write one row as consecutive (text, attr) runs after a single cursor move"""
+    win.move(row, col)
+    for text, attr in runs:
+        win.addstr(text, attr)
+
+
+@functools.lru_cache(maxsize=512)
+def _classify_swatch(hex_color: str) -> Tuple[int, bool]:
+    """Pick the closest basic color pair for a swatch and whether to dim it.
+
+    Returns:
+        Tuple of (color pair number, use_dim)
+    """
+    # Get RGB values
+    r, g, b = hex_to_rgb(hex_color)
+
+    # Calculate relative intensities
+    total = r + g + b
+    if total == 0:
+        # Pure black
+        return 3, True  # White text on black bg
+
+    # Normalize to find dominant color
+    r_norm = r / total
+    g_norm = g / total
+    b_norm = b / total
+
+    # Determine dominant color channel
+    max_channel = max(r, g, b)
+    use_dim = max_channel < 128  # Dim for dark colors
+
+    # Color selection based on dominant channels
+    if r_norm > 0.4 and g_norm > 0.4 and b_norm < 0.25:
+        block_color = 4  # Yellow (red + green)
+    elif r_norm > 0.4 and b_norm > 0.35:
+        block_color = 5  # Magenta (red + blue)
+    elif g_norm > 0.4 and b_norm > 0.35:
+        block_color = 2  # Cyan (green + blue)
+    elif r_norm > 0.45:
+        # Reddish - use green as closest bright color
+        block_color = 1  # Green (curses doesn't have bright red)
+    elif g_norm > 0.4:
+        block_color = 1  # Green
+    elif b_norm > 0.4:
+        block_color = 2  # Blue/Cyan
+    elif r_norm > 0.3 and g_norm > 0.3 and b_norm > 0.3:
+        # Balanced RGB = grey/white
+        block_color = 3  # White
+    else:
+        block_color = 3  # Default
+
+    return block_color, use_dim
+
+
+def backup_config(path: Path, backup_path: Path):
+    """Back up a config file, hardlinking it when the filesystem allows"""
+    # Files are only ever rewritten via write_config_atomic(), which swaps
+    # in a new inode, so a hardlink keeps the old contents intact
+    try:
+        os.link(path.resolve(), backup_path)
+    except OSError:
+        shutil.copy2(path, backup_path)
+
+
+def write_config_atomic(path: Path, content: str):
+    """Replace a config file's contents without a truncated window"""
+    # Write through symlinks (dotfiles are usually linked into $HOME)
+    target = path.resolve()
+    tmp = target.with_name(target.name + '.tmp')
+    tmp.write_text(content)
+    if target.exists():
+        shutil.copymode(target, tmp)
+    os.replace(tmp, target)
+
+
+# Previously applied theme blocks in tmux.conf and the shell rc files
+_TMUX_THEME_RE = re.compile(
+    r'# ========================================\n# Theme:.*?\n'
+    r'# ========================================.*?# ========================================',
+    re.DOTALL,
+)
+_SHELL_THEME_RE = re.compile(
+    r'# ======================================== TMUX THEME COLORS.*?'
+    r'# ======================================== END TMUX THEME COLORS\n',
+    re.DOTALL,
+)
+
+
+# Basic color pair used for each theme category's accents
+_CATEGORY_COLOR = {
+    "green": 1,
+    "blue": 2,
+    "purple": 5,
+    "pink": 5,
+    "orange": 4,
+    "cyan": 2,
+    "light": 3,
+}
+
+# Mock `eza -l -T --level 2` output for the preview: (tree, perms, name,
+# suffix, is_dir); the root entry has no tree connector
+_LISTING_ENTRIES = (
+    ("", "drwxr-xr-x  4 user group  4.0K  ", "projects", "/", True),
+    ("├──", "drwxr-xr-x  2 user group  4.0K  ", "frontend", "/", True),
+    ("│  ├──", "-rw-r--r--  1 user group  1.2K  ", "index.html", "", False),
+    ("│  └──", "-rw-r--r--  1 user group  3.4K  ", "style.css", "", False),
+    ("├──", "drwxr-xr-x  2 user group  4.0K  ", "backend", "/", True),
+    ("│  ├──", "-rw-r--r--  1 user group  5.6K  ", "server.py", "", False),
+    ("│  └──", "-rw-r--r--  1 user group   890  ", "config.json", "", False),
+    ("└──", "drwxr-xr-x  2 user group  4.0K  ", "docs", "/", True),
+    ("   ├──", "-rw-r--r--  1 user group  2.1K  ", "README.md", "", False),
+    ("   └──", "-rw-r--r--  1 user group  1.5K  ", "GUIDE.md", "", False),
+)
+
+# The same rows as ready-to-draw (prefix, name, is_dir) triples
+_LISTING = tuple(
+    (f"  {tree} {perms}" if tree else f"  {perms}", name + suffix, is_dir)
+    for tree, perms, name, suffix, is_dir in _LISTING_ENTRIES
+)
+
+
+# Static header, footer and preview section text
+_TITLE = f"TMUX THEME SWITCHER v{VERSION}"
+_INSTRUCTIONS = "↑↓: Navigate | Enter: Apply | Q: Quit"
+_FOOTER_TEXT = "Press ENTER to apply this theme (backups will be created)"
+_COLORS_TITLE = "[COLORS] Color Palette:"
+_PREVIEW_TITLE = "[PREVIEW] Tmux Status Bar Preview:"
+_FILES_TITLE = "[FILES] Directory Listing (eza -l -T --level 2):"
+
+# Screen panels, in the order they are painted
+PANELS = ("header", "sep", "list", "preview", "footer")
+
+
 class ThemeSwitcher:
     """Interactive theme switcher with TUI"""
 
@@ -845,6 +1055,10 @@ class ThemeSwitcher:
         self.themes = get_all_themes()
         self.scroll_offset = 0
         self.color_pairs = {}
+        self.panels = {}
+        self._dirty = set(PANELS)
+        self._last_minute = None
+        self._last_minute_str = ""
 
         # Initialize curses settings
         curses.curs_set(0)  # Hide cursor
@@ -855,6 +1069,51 @@ class ThemeSwitcher:
             curses.start_color()
             self.init_colors()
 
+        # Attribute values for every pair we use (including the dynamic
+        # 7-15), so drawing never calls into curses to build them
+        self.CP = [curses.color_pair(i) for i in range(16)]
+        self.CP_BOLD = [attr | curses.A_BOLD for attr in self.CP]
+        self.CP_REV = [attr | curses.A_REVERSE for attr in self.CP]
+        self.CP_DIM = [attr | curses.A_DIM for attr in self.CP]
+
+        self.layout()
+
+    def layout(self):
+        """Create one subwindow per panel for the current terminal size"""
+        height, width = self.stdscr.getmaxyx()
+        self.height, self.width = height, width
+
+        # Split layout: theme list on the left third, preview on the right
+        split_col = width // 3
+        content_start = 3
+        content_height = height - 6
+
+        self.header_win = curses.newwin(3, width, 0, 0)
+        self.sep_win = curses.newwin(content_height, 1, content_start, split_col)
+        self.list_win = curses.newwin(content_height, split_col, content_start, 0)
+        self.preview_win = curses.newwin(
+            content_height, width - split_col - 2, content_start, split_col + 2
+        )
+        self.footer_win = curses.newwin(3, width, height - 3, 0)
+
+        # Rules, borders and centered text only depend on the terminal size
+        self._hrule = "═" * width
+        self._title_col = (width - len(_TITLE)) // 2
+        self._instructions_col = (width - len(_INSTRUCTIONS)) // 2
+        self._footer_col = (width - len(_FOOTER_TEXT)) // 2
+        self._bar_width = min(width - split_col - 2 - 4, 50)
+        self._top_border = "┌" + "─" * self._bar_width + "┐"
+        self._bot_border = "└" + "─" * self._bar_width + "┘"
+
+        self.panels = {
+            "header": (self.header_win, self.draw_header),
+            "sep": (self.sep_win, self.draw_separator),
+            "list": (self.list_win, self.draw_theme_list),
+            "preview": (self.preview_win, self.draw_preview),
+            "footer": (self.footer_win, self.draw_footer),
+        }
+        self._dirty = set(PANELS)
+
     def init_colors(self):
         """Initialize color pairs for the TUI"""
         # Basic color pairs
@@ -905,28 +1164,42 @@ class ThemeSwitcher:
             # If terminal doesn't support color changes, fall back to approximations
             pass
 
+    def clock(self) -> str:
+        """Current time as HH:MM, formatted at most once per minute"""
+        now = time.time()
+        minute = int(now // 60)
+        if minute != self._last_minute:
+            self._last_minute = minute
+            self._last_minute_str = time.strftime('%H:%M', time.localtime(now))
+        return self._last_minute_str
+
     def draw_header(self):
         """Draw the header"""
-        height, width = self.stdscr.getmaxyx()
+        win = self.header_win
 
         # Title with version
-        title = f"TMUX THEME SWITCHER v{VERSION}"
-        self.stdscr.attron(curses.color_pair(1) | curses.A_BOLD)
-        self.stdscr.addstr(0, (width - len(title)) // 2, title)
-        self.stdscr.attroff(curses.color_pair(1) | curses.A_BOLD)
+        win.attron(self.CP_BOLD[1])
+        win.addstr(0, self._title_col, _TITLE)
+        win.attroff(self.CP_BOLD[1])
 
         # Instructions
-        instructions = "↑↓: Navigate | Enter: Apply | Q: Quit"
-        self.stdscr.attron(curses.color_pair(3))
-        self.stdscr.addstr(1, (width - len(instructions)) // 2, instructions)
-        self.stdscr.attroff(curses.color_pair(3))
+        win.attron(self.CP[3])
+        win.addstr(1, self._instructions_col, _INSTRUCTIONS)
+        win.attroff(self.CP[3])
 
         # Separator
-        self.stdscr.addstr(2, 0, "═" * width)
+        win.addstr(2, 0, self._hrule)
+
+    def draw_separator(self):
+        """Draw the vertical separator between the theme list and the preview"""
+        for i in range(self.sep_win.getmaxyx()[0]):
+            self.sep_win.addstr(i, 0, "│")
 
-    def draw_theme_list(self, start_row: int, end_row: int, col: int, width: int):
+    def draw_theme_list(self):
         """Draw the theme list on the left side"""
-        visible_height = end_row - start_row
+        win = self.list_win
+        visible_height, width = win.getmaxyx()
+        col = 0
 
         # Calculate scroll offset
         if self.current_idx < self.scroll_offset:
@@ -934,118 +1207,80 @@ class ThemeSwitcher:
         elif self.current_idx >= self.scroll_offset + visible_height:
             self.scroll_offset = self.current_idx - visible_height + 1
 
-        # Draw themes
-        row = start_row
-        last_category = None
-        idx = 0
+        # Only the themes that can possibly fit on screen; each takes at
+        # least one row, and category headers are emitted per group
+        visible = self.themes[self.scroll_offset:self.scroll_offset + visible_height]
+        groups = itertools.groupby(
+            enumerate(visible, self.scroll_offset), key=lambda entry: entry[1][0]
+        )
 
-        for category, theme in self.themes:
-            if idx < self.scroll_offset:
-                idx += 1
-                continue
-            if row >= end_row:
-                break
+        # Draw themes
+        row = 0
 
-            # Draw category header if new category
-            if category != last_category:
-                if row < end_row:
-                    self.stdscr.attron(curses.color_pair(4) | curses.A_BOLD)
-                    # Draw category text
-                    category_text = f" {category} "
-                    self.stdscr.addstr(row, col, category_text)
-                    # Fill rest of line with spaces up to the separator
-                    current_y, current_x = self.stdscr.getyx()
-                    spaces_needed = col + width - current_x
-                    if spaces_needed > 0:
-                        self.stdscr.addstr(" " * spaces_needed)
-                    self.stdscr.attroff(curses.color_pair(4) | curses.A_BOLD)
-                    row += 1
-                    last_category = category
-
-            if row >= end_row:
+        for category, entries in groups:
+            if row >= visible_height:
                 break
 
-            # Draw theme name
-            is_selected = (idx == self.current_idx)
-            prefix = "▶ " if is_selected else "  "
-
-            if is_selected:
-                self.stdscr.attron(curses.color_pair(6) | curses.A_BOLD)
-            else:
-                self.stdscr.attron(curses.color_pair(3))
-
-            theme_text = f"{prefix}{theme.name}"
-
-            # Draw theme text
-            self.stdscr.addstr(row, col, theme_text)
-
-            # Fill rest of line with spaces up to the separator
-            current_y, current_x = self.stdscr.getyx()
-            spaces_needed = col + width - current_x
-            if spaces_needed > 0:
-                self.stdscr.addstr(" " * spaces_needed)
-            elif spaces_needed < 0:
-                # Text is too long, need to truncate
-                # Move back and overwrite with "..."
-                self.stdscr.addstr(row, col + width - 3, "...")
+            # Draw category header, its attribute running up to the separator
+            win.addnstr(row, col, f" {category} ", width - 1)
+            win.chgat(row, col, self.CP_BOLD[4])
+            row += 1
 
-            if is_selected:
-                self.stdscr.attroff(curses.color_pair(6) | curses.A_BOLD)
-            else:
-                self.stdscr.attroff(curses.color_pair(3))
+            for idx, (_, theme) in entries:
+                if row >= visible_height:
+                    break
 
-            row += 1
-            idx += 1
+                # Draw theme name; the selection bar spans the whole row
+                is_selected = (idx == self.current_idx)
+                if is_selected:
+                    prefix = "▶ "
+                    attr = self.CP_BOLD[6]
+                else:
+                    prefix = "  "
+                    attr = self.CP[3]
+
+                theme_text = f"{prefix}{theme.name}"
+                if len(theme_text) > width - 1:
+                    theme_text = theme_text[:width - 4] + "..."
+                win.addnstr(row, col, theme_text, width - 1)
+                win.chgat(row, col, attr)
+                row += 1
 
-    def draw_preview(self, start_row: int, end_row: int, col: int, width: int):
+    def draw_preview(self):
         """Draw the theme preview on the right side"""
+        win = self.preview_win
+        end_row, width = win.getmaxyx()
+        col = 0
         _, theme = self.themes[self.current_idx]
 
-        row = start_row
-
-        # Get the category color for this theme
-        if theme.category == "green":
-            category_color = 1
-        elif theme.category == "blue":
-            category_color = 2
-        elif theme.category in ("purple", "pink"):
-            category_color = 5
-        elif theme.category == "orange":
-            category_color = 4
-        elif theme.category == "cyan":
-            category_color = 2
-        elif theme.category == "light":
-            category_color = 3
-        else:
-            category_color = 1
+        row = 0
 
-        # Theme name and description
-        self.stdscr.attron(curses.color_pair(category_color) | curses.A_BOLD)
-        self.stdscr.addstr(row, col, f"[THEME] {theme.name}")
-        self.stdscr.attroff(curses.color_pair(category_color) | curses.A_BOLD)
+        # Attributes derived from the theme's category color
+        category_color = _CATEGORY_COLOR.get(theme.category, 1)
+        accent = self.CP_BOLD[category_color]
+        accent_rev = accent | curses.A_REVERSE
+        accent_hint = self.CP_REV[category_color]
+        plain = self.CP[3]
 
-        # Category indicator
-        self.stdscr.attron(curses.color_pair(3))
-        self.stdscr.addstr(f" ({theme.category.upper()})")
-        self.stdscr.attroff(curses.color_pair(3))
+        # Theme name and category indicator
+        addstr_runs(win, row, col, (
+            (f"[THEME] {theme.name}", accent),
+            (f" ({theme.category.upper()})", plain),
+        ))
         row += 1
 
-        self.stdscr.attron(curses.color_pair(3))
         desc = theme.description
         if len(desc) > width - 2:
             desc = desc[:width-5] + "..."
-        self.stdscr.addstr(row, col, desc)
-        self.stdscr.attroff(curses.color_pair(3))
+        win.addstr(row, col, desc, plain)
         row += 2
 
         # Color swatches with visual blocks
-        self.stdscr.attron(curses.color_pair(5) | curses.A_BOLD)
-        self.stdscr.addstr(row, col, "[COLORS] Color Palette:")
-        self.stdscr.attroff(curses.color_pair(5) | curses.A_BOLD)
+        win.addstr(row, col, _COLORS_TITLE, self.CP_BOLD[5])
         row += 1
 
         # Show color swatches with colored blocks
-        for name, hex_color in theme.color_swatches.items():
+        for label, hex_color, dimmable in theme.swatch_lines:
             if row >= end_row - 15:
                 break
 
@@ -1054,61 +1289,19 @@ class ThemeSwitcher:
 
             # Try to use dynamic colors if available, otherwise use static
             try:
-                # Get RGB values
-                r, g, b = hex_to_rgb(hex_color)
-
-                # Calculate relative intensities
-                total = r + g + b
-                if total == 0:
-                    # Pure black
-                    block_color = 3  # White text on black bg
-                    use_dim = True
-                else:
-                    # Normalize to find dominant color
-                    r_norm = r / total
-                    g_norm = g / total
-                    b_norm = b / total
-
-                    # Determine dominant color channel
-                    max_channel = max(r, g, b)
-                    use_dim = max_channel < 128  # Dim for dark colors
-
-                    # Color selection based on dominant channels
-                    if r_norm > 0.4 and g_norm > 0.4 and b_norm < 0.25:
-                        block_color = 4  # Yellow (red + green)
-                    elif r_norm > 0.4 and b_norm > 0.35:
-                        block_color = 5  # Magenta (red + blue)
-                    elif g_norm > 0.4 and b_norm > 0.35:
-                        block_color = 2  # Cyan (green + blue)
-                    elif r_norm > 0.45:
-                        # Reddish - use green as closest bright color
-                        block_color = 1  # Green (curses doesn't have bright red)
-                    elif g_norm > 0.4:
-                        block_color = 1  # Green
-                    elif b_norm > 0.4:
-                        block_color = 2  # Blue/Cyan
-                    elif r_norm > 0.3 and g_norm > 0.3 and b_norm > 0.3:
-                        # Balanced RGB = grey/white
-                        block_color = 3  # White
-                    else:
-                        block_color = 3  # Default
-
-                attr = curses.color_pair(block_color) | curses.A_BOLD
-                if use_dim and name.upper() in ['BG', 'BORDER']:
-                    attr = curses.color_pair(block_color) | curses.A_DIM
-
-                self.stdscr.attron(attr)
-                self.stdscr.addstr(row, col, f"  {color_block}")
-                self.stdscr.attroff(attr)
-
-                self.stdscr.attron(curses.color_pair(3))
-                self.stdscr.addstr(f" {name:12} {hex_color}")
-                self.stdscr.attroff(curses.color_pair(3))
+                block_color, use_dim = _classify_swatch(hex_color)
+
+                attr = self.CP_BOLD[block_color]
+                if use_dim and dimmable:
+                    attr = self.CP_DIM[block_color]
+
+                addstr_runs(win, row, col, (
+                    (f"  {color_block}", attr),
+                    (label, plain),
+                ))
             except Exception as e:
                 # Fallback to plain text
-                self.stdscr.attron(curses.color_pair(3))
-                self.stdscr.addstr(row, col, f"  {color_block} {name:12} {hex_color}")
-                self.stdscr.attroff(curses.color_pair(3))
+                win.addstr(row, col, f"  {color_block}{label}", plain)
 
             row += 1
 
@@ -1116,18 +1309,15 @@ class ThemeSwitcher:
 
         # Mock tmux status bar with theme colors
         if row + 5 < end_row:
-            self.stdscr.attron(curses.color_pair(5) | curses.A_BOLD)
-            self.stdscr.addstr(row, col, "[PREVIEW] Tmux Status Bar Preview:")
-            self.stdscr.attroff(curses.color_pair(5) | curses.A_BOLD)
+            win.addstr(row, col, _PREVIEW_TITLE,
+                       self.CP_BOLD[5])
             row += 1
 
-            bar_width = min(width - 4, 50)
+            bar_width = self._bar_width
 
             # Show a colorful representation using the theme description
             # Top border in border color style
-            self.stdscr.attron(curses.color_pair(3))
-            self.stdscr.addstr(row, col, "┌" + "─" * bar_width + "┐")
-            self.stdscr.attroff(curses.color_pair(3))
+            win.addstr(row, col, self._top_border, plain)
             row += 1
 
             # Status bar content with color indicators
@@ -1140,212 +1330,132 @@ class ThemeSwitcher:
             # More windows
             status_more = " 2:vim "
             # Right part (normal) - time
-            status_right = datetime.now().strftime('%H:%M')
+            status_right = self.clock()
 
             # Calculate padding
             used = len(status_left) + len(status_middle) + len(status_active) + len(status_more) + len(status_right) + 1
             padding = max(0, bar_width - used)
 
-            # Draw the status line with visual color indicators
-            self.stdscr.attron(curses.color_pair(3))
-            self.stdscr.addstr(row, col, "│")
-            self.stdscr.attroff(curses.color_pair(3))
-
-            # Session in accent color (use theme category color)
-            self.stdscr.attron(curses.color_pair(category_color) | curses.A_BOLD)
-            self.stdscr.addstr(status_left)
-            self.stdscr.attroff(curses.color_pair(category_color) | curses.A_BOLD)
-
-            # Regular window
-            self.stdscr.attron(curses.color_pair(3))
-            self.stdscr.addstr(status_middle)
-            self.stdscr.attroff(curses.color_pair(3))
-
-            # Active window indicator (highlighted, also use category color)
-            self.stdscr.attron(curses.color_pair(category_color) | curses.A_BOLD | curses.A_REVERSE)
-            self.stdscr.addstr(status_active)
-            self.stdscr.attroff(curses.color_pair(category_color) | curses.A_BOLD | curses.A_REVERSE)
-
-            # More windows
-            self.stdscr.attron(curses.color_pair(3))
-            self.stdscr.addstr(status_more)
-            # Padding
-            self.stdscr.addstr(" " * padding)
-            # Time
-            self.stdscr.addstr(status_right)
-            self.stdscr.addstr("│")
-            self.stdscr.attroff(curses.color_pair(3))
+            # Draw the status line: session and active window in the
+            # theme's category color, everything else plain
+            addstr_runs(win, row, col, (
+                ("│", plain),
+                (status_left, accent),
+                (status_middle, plain),
+                (status_active, accent_rev),
+                (status_more + " " * padding + status_right + "│", plain),
+            ))
             row += 1
 
             # Bottom border
-            self.stdscr.attron(curses.color_pair(3))
-            self.stdscr.addstr(row, col, "└" + "─" * bar_width + "┘")
-            self.stdscr.attroff(curses.color_pair(3))
+            win.addstr(row, col, self._bot_border, plain)
             row += 1
 
             # Add color legend (use theme category color)
-            self.stdscr.attron(curses.color_pair(3))
-            legend = "  (Colors: "
-            self.stdscr.addstr(row, col, legend)
-            self.stdscr.attroff(curses.color_pair(3))
-
-            self.stdscr.attron(curses.color_pair(category_color) | curses.A_BOLD)
-            self.stdscr.addstr("accent")
-            self.stdscr.attroff(curses.color_pair(category_color) | curses.A_BOLD)
-
-            self.stdscr.attron(curses.color_pair(3))
-            self.stdscr.addstr(", ")
-            self.stdscr.attroff(curses.color_pair(3))
-
-            self.stdscr.attron(curses.color_pair(category_color) | curses.A_REVERSE)
-            self.stdscr.addstr("active")
-            self.stdscr.attroff(curses.color_pair(category_color) | curses.A_REVERSE)
-
-            self.stdscr.attron(curses.color_pair(3))
-            self.stdscr.addstr(")")
-            self.stdscr.attroff(curses.color_pair(3))
+            addstr_runs(win, row, col, (
+                ("  (Colors: ", plain),
+                ("accent", accent),
+                (", ", plain),
+                ("active", accent_hint),
+                (")", plain),
+            ))
             row += 2
 
         # Directory listing preview (eza -l -T --level 2 style)
         if row + 10 < end_row:
-            self.stdscr.attron(curses.color_pair(5) | curses.A_BOLD)
-            self.stdscr.addstr(row, col, "[FILES] Directory Listing (eza -l -T --level 2):")
-            self.stdscr.attroff(curses.color_pair(5) | curses.A_BOLD)
+            win.addstr(row, col, _FILES_TITLE,
+                       self.CP_BOLD[5])
             row += 1
 
-            # Simulate directory tree with colored directories
-            listing = [
-                ("drwxr-xr-x  4 user group  4.0K  ", "projects", "/", True),
-                ("├──", "drwxr-xr-x  2 user group  4.0K  ", "frontend", "/", True),
-                ("│  ├──", "-rw-r--r--  1 user group  1.2K  ", "index.html", "", False),
-                ("│  └──", "-rw-r--r--  1 user group  3.4K  ", "style.css", "", False),
-                ("├──", "drwxr-xr-x  2 user group  4.0K  ", "backend", "/", True),
-                ("│  ├──", "-rw-r--r--  1 user group  5.6K  ", "server.py", "", False),
-                ("│  └──", "-rw-r--r--  1 user group   890  ", "config.json", "", False),
-                ("└──", "drwxr-xr-x  2 user group  4.0K  ", "docs", "/", True),
-                ("   ├──", "-rw-r--r--  1 user group  2.1K  ", "README.md", "", False),
-                ("   └──", "-rw-r--r--  1 user group  1.5K  ", "GUIDE.md", "", False),
-            ]
-
-            for item in listing:
+            for prefix, name, is_dir in _LISTING:
                 if row >= end_row:
                     break
 
-                # Handle different tuple lengths
-                if len(item) == 5:
-                    tree, perms, name, suffix, is_dir = item
-                    self.stdscr.attron(curses.color_pair(3))
-                    self.stdscr.addstr(row, col, f"  {tree} ")
-                    self.stdscr.addstr(perms)
-                    self.stdscr.attroff(curses.color_pair(3))
-
-                    # Color the name based on whether it's a directory
-                    # Use color based on theme category (reuse category_color from above)
-                    if is_dir:
-                        self.stdscr.attron(curses.color_pair(category_color) | curses.A_BOLD)
-                    else:
-                        self.stdscr.attron(curses.color_pair(3))
-
-                    self.stdscr.addstr(name + suffix)
-
-                    if is_dir:
-                        self.stdscr.attroff(curses.color_pair(category_color) | curses.A_BOLD)
-                    else:
-                        self.stdscr.attroff(curses.color_pair(3))
-                else:
-                    # Simple line (header)
-                    perms, name, suffix, is_dir = item
-                    self.stdscr.attron(curses.color_pair(3))
-                    self.stdscr.addstr(row, col, f"  {perms}")
-                    self.stdscr.attroff(curses.color_pair(3))
-
-                    if is_dir:
-                        # Use color based on theme category (reuse category_color)
-                        self.stdscr.attron(curses.color_pair(category_color) | curses.A_BOLD)
-                    else:
-                        self.stdscr.attron(curses.color_pair(3))
-
-                    self.stdscr.addstr(name + suffix)
-
-                    if is_dir:
-                        self.stdscr.attroff(curses.color_pair(category_color) | curses.A_BOLD)
-                    else:
-                        self.stdscr.attroff(curses.color_pair(3))
-
+                # Directories use the theme category color
+                addstr_runs(win, row, col, (
+                    (prefix, plain),
+                    (name, accent if is_dir else plain),
+                ))
                 row += 1
 
             # Add color note
             if row < end_row:
-                self.stdscr.attron(curses.color_pair(3))
-                note = f"  (Directories shown in "
-                self.stdscr.addstr(row, col, note)
-                self.stdscr.attroff(curses.color_pair(3))
-
-                self.stdscr.attron(curses.color_pair(category_color) | curses.A_BOLD)
-                self.stdscr.addstr("theme color")
-                self.stdscr.attroff(curses.color_pair(category_color) | curses.A_BOLD)
-
-                self.stdscr.attron(curses.color_pair(3))
-                self.stdscr.addstr(")")
-                self.stdscr.attroff(curses.color_pair(3))
+                addstr_runs(win, row, col, (
+                    ("  (Directories shown in ", plain),
+                    ("theme color", accent),
+                    (")", plain),
+                ))
 
     def draw_footer(self):
         """Draw the footer with apply button"""
-        height, width = self.stdscr.getmaxyx()
+        win = self.footer_win
 
         # Separator
-        self.stdscr.addstr(height - 3, 0, "═" * width)
+        win.addstr(0, 0, self._hrule)
 
         # Footer text
-        footer = "Press ENTER to apply this theme (backups will be created)"
-        self.stdscr.attron(curses.color_pair(5))
-        self.stdscr.addstr(height - 2, (width - len(footer)) // 2, footer)
-        self.stdscr.attroff(curses.color_pair(5))
+        win.attron(self.CP[5])
+        win.addstr(1, self._footer_col, _FOOTER_TEXT)
+        win.attroff(self.CP[5])
 
     def draw(self):
-        """Draw the entire UI"""
-        self.stdscr.clear()
-        height, width = self.stdscr.getmaxyx()
-
-        # Draw header
-        self.draw_header()
-
-        # Calculate split layout
-        split_col = width // 3
-        content_start = 3
-        content_end = height - 3
-
-        # Draw vertical separator
-        for i in range(content_start, content_end):
-            self.stdscr.addstr(i, split_col, "│")
-
-        # Draw theme list (left side)
-        self.draw_theme_list(content_start, content_end, 0, split_col)
-
-        # Draw preview (right side)
-        self.draw_preview(content_start, content_end, split_col + 2, width - split_col - 2)
-
-        # Draw footer
-        self.draw_footer()
+        """Redraw the invalidated panels and push them to the terminal in one update"""
+        if self._dirty.issuperset(PANELS):
+            # Full repaint (startup, resize, after the apply dialog): also
+            # wipe stdscr so nothing outside the panels survives
+            self.stdscr.clear()
+            self.stdscr.noutrefresh()
+
+        for name in PANELS:
+            if name not in self._dirty:
+                continue
 
-        self.stdscr.refresh()
+            win, paint = self.panels[name]
+            win.erase()
+            win.attrset(curses.A_NORMAL)
+            try:
+                paint()
+            except curses.error:
+                # Writing the bottom-right cell of a window raises after the
+                # character is drawn; anything past the panel edge is clipped.
+                pass
+            win.noutrefresh()
+
+        curses.doupdate()
+        self._dirty.clear()
+
+    def move_selection(self, delta: int):
+        """Move the selection by delta, staying within the theme list"""
+        new_idx = min(max(self.current_idx + delta, 0), len(self.themes) - 1)
+        if new_idx != self.current_idx:
+            self.current_idx = new_idx
+            self._dirty.update(("list", "preview"))
 
     def handle_input(self) -> bool:
         """Handle keyboard input. Returns False to quit."""
         key = self.stdscr.getch()
 
+        if key in (curses.KEY_UP, curses.KEY_DOWN):
+            # Apply every arrow key already queued (key repeat) before
+            # drawing again, so a held key costs one redraw per batch
+            self.stdscr.timeout(0)
+            try:
+                while key in (curses.KEY_UP, curses.KEY_DOWN):
+                    self.move_selection(-1 if key == curses.KEY_UP else 1)
+                    key = self.stdscr.getch()
+            finally:
+                self.stdscr.timeout(-1)
+
         if key == ord('q') or key == ord('Q'):
             return False
-        elif key == curses.KEY_UP:
-            if self.current_idx > 0:
-                self.current_idx -= 1
-        elif key == curses.KEY_DOWN:
-            if self.current_idx < len(self.themes) - 1:
-                self.current_idx += 1
+        elif key == curses.KEY_RESIZE:
+            self.layout()
         elif key == ord('\n') or key == curses.KEY_ENTER or key == 10:
             # Apply theme
             _, theme = self.themes[self.current_idx]
             self.apply_theme(theme)
+            # The dialog was drawn over every panel
+            self._dirty.update(PANELS)
 
         return True
 
@@ -1365,33 +1475,33 @@ class ThemeSwitcher:
             self.stdscr.addstr(start_row + i, start_col, " " * dialog_width)
 
         # Draw border
-        self.stdscr.attron(curses.color_pair(1) | curses.A_BOLD)
+        self.stdscr.attron(self.CP_BOLD[1])
         self.stdscr.addstr(start_row, start_col, "┌" + "─" * (dialog_width - 2) + "┐")
         for i in range(1, dialog_height - 1):
             self.stdscr.addstr(start_row + i, start_col, "│")
             self.stdscr.addstr(start_row + i, start_col + dialog_width - 1, "│")
         self.stdscr.addstr(start_row + dialog_height - 1, start_col, "└" + "─" * (dialog_width - 2) + "┘")
-        self.stdscr.attroff(curses.color_pair(1) | curses.A_BOLD)
+        self.stdscr.attroff(self.CP_BOLD[1])
 
         # Dialog content
-        self.stdscr.attron(curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.attron(self.CP_BOLD[5])
         title = f"Apply Theme: {theme.name}"
         self.stdscr.addstr(start_row + 2, start_col + (dialog_width - len(title)) // 2, title)
-        self.stdscr.attroff(curses.color_pair(5) | curses.A_BOLD)
+        self.stdscr.attroff(self.CP_BOLD[5])
 
-        self.stdscr.attron(curses.color_pair(3))
+        self.stdscr.attron(self.CP[3])
         msg1 = "This will backup and modify:"
         self.stdscr.addstr(start_row + 4, start_col + (dialog_width - len(msg1)) // 2, msg1)
         msg2 = "• ~/.tmux.conf"
         self.stdscr.addstr(start_row + 5, start_col + (dialog_width - len(msg2)) // 2, msg2)
         msg3 = "• ~/.zshrc or ~/.bashrc"
         self.stdscr.addstr(start_row + 6, start_col + (dialog_width - len(msg3)) // 2, msg3)
-        self.stdscr.attroff(curses.color_pair(3))
+        self.stdscr.attroff(self.CP[3])
 
-        self.stdscr.attron(curses.color_pair(2) | curses.A_BOLD)
+        self.stdscr.attron(self.CP_BOLD[2])
         prompt = "Press ENTER to confirm, ESC to cancel"
         self.stdscr.addstr(start_row + 8, start_col + (dialog_width - len(prompt)) // 2, prompt)
-        self.stdscr.attroff(curses.color_pair(2) | curses.A_BOLD)
+        self.stdscr.attroff(self.CP_BOLD[2])
 
         self.stdscr.refresh()
 
@@ -1411,15 +1521,15 @@ class ThemeSwitcher:
             for i in range(dialog_height):
                 self.stdscr.addstr(start_row + i, start_col, " " * dialog_width)
 
-            self.stdscr.attron(curses.color_pair(1) | curses.A_BOLD)
+            self.stdscr.attron(self.CP_BOLD[1])
             success = "[OK] Theme Applied Successfully!"
             self.stdscr.addstr(start_row + 4, start_col + (dialog_width - len(success)) // 2, success)
-            self.stdscr.attroff(curses.color_pair(1) | curses.A_BOLD)
+            self.stdscr.attroff(self.CP_BOLD[1])
 
-            self.stdscr.attron(curses.color_pair(3))
+            self.stdscr.attron(self.CP[3])
             info = "Press any key to continue..."
             self.stdscr.addstr(start_row + 6, start_col + (dialog_width - len(info)) // 2, info)
-            self.stdscr.attroff(curses.color_pair(3))
+            self.stdscr.attroff(self.CP[3])
 
             self.stdscr.refresh()
             self.stdscr.getch()
@@ -1429,17 +1539,17 @@ class ThemeSwitcher:
             for i in range(dialog_height):
                 self.stdscr.addstr(start_row + i, start_col, " " * dialog_width)
 
-            self.stdscr.attron(curses.color_pair(1))
+            self.stdscr.attron(self.CP[1])
             error = "[ERROR] Error Applying Theme"
             self.stdscr.addstr(start_row + 4, start_col + (dialog_width - len(error)) // 2, error)
-            self.stdscr.attroff(curses.color_pair(1))
+            self.stdscr.attroff(self.CP[1])
 
-            self.stdscr.attron(curses.color_pair(3))
+            self.stdscr.attron(self.CP[3])
             err_msg = str(e)[:dialog_width-4]
             self.stdscr.addstr(start_row + 5, start_col + 2, err_msg)
             info = "Press any key to continue..."
             self.stdscr.addstr(start_row + 7, start_col + (dialog_width - len(info)) // 2, info)
-            self.stdscr.attroff(curses.color_pair(3))
+            self.stdscr.attroff(self.CP[3])
 
             self.stdscr.refresh()
             self.stdscr.getch()
@@ -1462,12 +1572,12 @@ class ThemeSwitcher:
         # Backup tmux.conf
         if tmux_conf.exists():
             backup_path = home / f".tmux.conf.backup.{timestamp}"
-            shutil.copy2(tmux_conf, backup_path)
+            backup_config(tmux_conf, backup_path)
 
         # Backup shell rc
         if shell_rc.exists():
             backup_path = home / f"{shell_rc.name}.backup.{timestamp}"
-            shutil.copy2(shell_rc, backup_path)
+            backup_config(shell_rc, backup_path)
 
         # Apply tmux theme
         self.apply_tmux_theme(tmux_conf, theme)
@@ -1475,116 +1585,39 @@ class ThemeSwitcher:
         # Apply shell theme
         self.apply_shell_theme(shell_rc, theme)
 
-        # Reload tmux if running
+        # Reload tmux if running (subprocess is only needed here, so keep it
+        # off the startup path)
+        import subprocess
+
+        # Both commands go through one tmux client; ";" separates them
         try:
-            subprocess.run(["tmux", "source-file", str(tmux_conf)],
-                         stderr=subprocess.DEVNULL, check=False)
-            subprocess.run(["tmux", "display-message", f"Theme '{theme.name}' loaded!"],
+            subprocess.run(["tmux", "source-file", str(tmux_conf), ";",
+                            "display-message", f"Theme '{theme.name}' loaded!"],
                          stderr=subprocess.DEVNULL, check=False)
         except:
             pass
 
     def apply_tmux_theme(self, tmux_conf: Path, theme: Theme):
         """Apply theme to tmux.conf"""
-        # Create theme block
-        theme_block = f"""
-# ========================================
-# Theme: {theme.name}
-# ========================================
-
-# Status bar colors
-set -g status-style bg={theme.bg_color},fg={theme.fg_color}
-set -g status-left-style bg={theme.bg_color},fg={theme.accent_color}
-set -g status-right-style bg={theme.bg_color},fg={theme.fg_color}
-
-# Pane border colors
-set -g pane-border-style fg={theme.border_color}
-set -g pane-active-border-style fg={theme.border_active}
-
-# Window status colors
-setw -g window-status-style fg={theme.fg_color},bg={theme.bg_color}
-setw -g window-status-current-style fg={theme.bg_color},bg={theme.accent_color},bold
-
-# Message colors
-set -g message-style bg={theme.message_bg},fg={theme.message_fg},bold
-set -g message-command-style bg={theme.message_bg},fg={theme.message_fg},bold
-
-# Activity color
-setw -g window-status-activity-style fg={theme.activity_color},bg={theme.bg_color}
-
-# ========================================
-"""
-
-        # Read current config
-        if tmux_conf.exists():
-            with open(tmux_conf, 'r') as f:
-                content = f.read()
-
-            # Remove old theme block if exists
-            import re
-            pattern = r'# ========================================\n# Theme:.*?\n# ========================================.*?# ========================================'
-            content = re.sub(pattern, '', content, flags=re.DOTALL)
-
-            # Append new theme
-            with open(tmux_conf, 'w') as f:
-                f.write(content.rstrip() + '\n' + theme_block)
-        else:
-            # Create new config with theme
-            with open(tmux_conf, 'w') as f:
-                f.write(theme_block)
+        # Remove old theme block if exists, then append the new theme
+        content = tmux_conf.read_text() if tmux_conf.exists() else ""
+        content = _TMUX_THEME_RE.sub('', content).rstrip()
+        write_config_atomic(tmux_conf, (content + '\n' if content else '') + theme.tmux_block)
 
     def apply_shell_theme(self, shell_rc: Path, theme: Theme):
         """Apply theme to shell rc file"""
-        shell_block = f"""
-# ======================================== TMUX THEME COLORS
-# Auto-generated by tmux-theme-switcher.py
-# Theme: {theme.name}
-# ========================================
-
-# EZA color configuration (for directory colors)
-export EZA_COLORS="di={theme.dir_color}:ln=01;36:so=01;35:pi=40;33:ex={theme.dir_color}:bd=40;33;01:cd=40;33;01:su=37;41:sg=30;43:tw=30;42:ow={theme.dir_color}:uu={theme.dir_color}:gu={theme.dir_color}"
-
-# Traditional LS_COLORS (fallback for standard ls command)
-export LS_COLORS="di={theme.dir_color}:ln=01;36:so=01;35:pi=40;33:ex={theme.dir_color}:bd=40;33;01:cd=40;33;01:su=37;41:sg=30;43:tw=30;42:ow={theme.dir_color}"
-
-# Bat theme (syntax highlighting)
-export BAT_THEME="{theme.bat_theme}"
-
-# FZF colors (matching theme)
-export FZF_DEFAULT_OPTS="--color=fg:-1,bg:-1,hl:{theme.dir_color},fg+:#ffffff,bg+:#3a3a3a,hl+:{theme.dir_color} --color=info:{theme.dir_color},prompt:{theme.dir_color},pointer:{theme.dir_color},marker:{theme.dir_color},spinner:{theme.dir_color}"
-
-# PS1 Configuration
-export PS1="{theme.ps1_color}\\u\\[\\033[00m\\]@\\h:\\[\\033[01;34m\\]\\w\\[\\033[00m\\]\\$ "
-
-# Alias ll to eza -l
-alias ll='eza -l'
-
-# Alias llt to eza -l -T --level 2 -a
-alias llt='eza -l -T --level 2 -a'
-
-# ======================================== END TMUX THEME COLORS
-"""
-
-        if shell_rc.exists():
-            with open(shell_rc, 'r') as f:
-                content = f.read()
-
-            # Remove old theme block
-            import re
-            pattern = r'# ======================================== TMUX THEME COLORS.*?# ======================================== END TMUX THEME COLORS\n'
-            content = re.sub(pattern, '', content, flags=re.DOTALL)
-
-            # Append new theme
-            with open(shell_rc, 'w') as f:
-                f.write(content.rstrip() + '\n' + shell_block)
-        else:
-            with open(shell_rc, 'w') as f:
-                f.write(shell_block)
+        # Remove old theme block, then append the new theme
+        content = shell_rc.read_text() if shell_rc.exists() else ""
+        content = _SHELL_THEME_RE.sub('', content).rstrip()
+        write_config_atomic(shell_rc, (content + '\n' if content else '') + theme.shell_block)
 
     def run(self):
         """Main loop"""
         while True:
-            self.draw()
+            # Keys that change nothing (or unmapped keys) leave no dirty
+            # panels, so they cost a getch() and nothing else
+            if self._dirty:
+                self.draw()
             if not self.handle_input():
                 break
 
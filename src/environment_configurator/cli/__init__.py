@@ -1,3 +1,3 @@
 """Command-line interfaces for environment configurator."""
 
-__all__ = ["main", "theme_switcher", "session_manager", "config_merger"]
+__all__ = ["main", "theme_switcher", "session_manager", "config_merger", "context"]
@@ -44,11 +44,12 @@ def main(dry_run: bool, bashrc: str, zshrc: str) -> None:
     if zshrc:
         args.extend(["--zshrc", zshrc])
 
-    # Execute the original script with arguments
-    import subprocess
+    # Execute the original script with arguments in this interpreter rather
+    # than paying for a second Python startup
+    import runpy
 
-    result = subprocess.run([sys.executable, str(original_script), *args])
-    sys.exit(result.returncode)
+    sys.argv = [str(original_script), *args]
+    runpy.run_path(str(original_script), run_name="__main__")
 
 
 if __name__ == "__main__":
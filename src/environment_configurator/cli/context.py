@@ -0,0 +1,21 @@
+"""
+Shared state for the command-line interfaces.
+
+Holds the options a CLI group hands down to its subcommands.
+"""
+
+from dataclasses import dataclass
+
+import click
+
+
+@dataclass
+class CLIContext:
+    """Options set on a CLI group and read by its subcommands."""
+
+    verbose: bool = False
+
+
+# Passes the group's CLIContext to a subcommand (creating a default one if
+# the subcommand is invoked on its own)
+pass_cli_context = click.make_pass_decorator(CLIContext, ensure=True)
@@ -4,19 +4,34 @@ Main CLI for environment configurator.
 Provides the primary command-line interface for installation and management.
 """
 
+from __future__ import annotations
+
 import logging
+import os
 import sys
 from pathlib import Path
 
 import click
 
 from environment_configurator import __version__
+from environment_configurator.cli.context import CLIContext, pass_cli_context
 from environment_configurator.utils.logger import setup_logging, get_logger
-from environment_configurator.installer.config import InstallerConfig
-from environment_configurator.installer.installer import EnvironmentInstaller
+from environment_configurator.utils.shell_utils import (
+    detect_shell,
+    check_python_version,
+    get_terminal_size,
+)
 
 logger = get_logger(__name__)
 
+_RULE = "=" * 60
+
+_NEXT_STEPS = """
+Next steps:
+1. Restart your shell or run: source ~/.bashrc (or ~/.zshrc)
+2. Run 'update-env-config' anytime to pull latest changes
+3. Run 'tmux-theme-switcher' to customize your tmux theme"""
+
 
 @click.group()
 @click.version_option(version=__version__)
@@ -25,9 +40,6 @@ logger = get_logger(__name__)
 @click.pass_context
 def cli(ctx: click.Context, verbose: bool, log_file: str) -> None:
     """Environment Configurator - Manage your development environment."""
-    # Ensure context object exists
-    ctx.ensure_object(dict)
-
     # Setup logging
     log_level = logging.DEBUG if verbose else logging.INFO
     log_path = Path(log_file) if log_file else None
@@ -39,7 +51,7 @@ def cli(ctx: click.Context, verbose: bool, log_file: str) -> None:
         enable_file_logging=True,
     )
 
-    ctx.obj["verbose"] = verbose
+    ctx.obj = CLIContext(verbose=verbose)
 
 
 @cli.command()
@@ -54,9 +66,9 @@ def cli(ctx: click.Context, verbose: bool, log_file: str) -> None:
 @click.option("--no-fonts", is_flag=True, help="Skip font installation")
 @click.option("--no-auto-update", is_flag=True, help="Disable auto-update")
 @click.option("--use-password", is_flag=True, help="Use password auth (deprecated)")
-@click.pass_context
+@pass_cli_context
 def install(
-    ctx: click.Context,
+    cli_ctx: CLIContext,
     test: bool,
     repo_url: str,
     branch: str,
@@ -66,7 +78,12 @@ def install(
     use_password: bool,
 ) -> None:
     """Install the environment configuration."""
-    verbose = ctx.obj.get("verbose", False)
+    from dataclasses import replace
+
+    from environment_configurator.installer.config import InstallerConfig
+    from environment_configurator.installer.installer import EnvironmentInstaller
+
+    verbose = cli_ctx.verbose
 
     logger.info(f"Environment Configurator v{__version__}")
     logger.info("Starting installation...")
@@ -82,7 +99,7 @@ def install(
     )
 
     if install_dir:
-        config.install_dir = Path(install_dir)
+        config = replace(config, install_dir=Path(install_dir))
 
     # Run installation
     installer = EnvironmentInstaller(config)
@@ -94,10 +111,7 @@ def install(
             click.secho("\n✓ Installation completed successfully!", fg="green", bold=True)
 
             if not test:
-                click.echo("\nNext steps:")
-                click.echo("1. Restart your shell or run: source ~/.bashrc (or ~/.zshrc)")
-                click.echo("2. Run 'update-env-config' anytime to pull latest changes")
-                click.echo("3. Run 'tmux-theme-switcher' to customize your tmux theme")
+                click.echo(_NEXT_STEPS)
 
             sys.exit(0)
         else:
@@ -112,10 +126,13 @@ def install(
 
 @cli.command()
 @click.option("--test", is_flag=True, help="Run in test mode (no changes)")
-@click.pass_context
-def uninstall(ctx: click.Context, test: bool) -> None:
+@pass_cli_context
+def uninstall(cli_ctx: CLIContext, test: bool) -> None:
     """Uninstall the environment configuration."""
-    verbose = ctx.obj.get("verbose", False)
+    from environment_configurator.installer.config import InstallerConfig
+    from environment_configurator.installer.installer import EnvironmentInstaller
+
+    verbose = cli_ctx.verbose
 
     if not test:
         click.confirm(
@@ -143,14 +160,13 @@ def uninstall(ctx: click.Context, test: bool) -> None:
 
 
 @cli.command()
-@click.pass_context
-def status(ctx: click.Context) -> None:
+def status() -> None:
     """Show installation status."""
+    from environment_configurator.installer.config import InstallerConfig
+
     config = InstallerConfig()
 
-    click.echo("\n" + "=" * 60)
-    click.echo("Environment Configurator Status")
-    click.echo("=" * 60)
+    click.echo(f"\n{_RULE}\nEnvironment Configurator Status\n{_RULE}")
 
     # Check if installed
     if config.install_dir.exists():
@@ -158,42 +174,39 @@ def status(ctx: click.Context) -> None:
 
         # Check for dotfiles
         home = Path.home()
-        dotfiles = [".bashrc", ".zshrc", ".gitconfig", ".tmux.conf"]
+        install_dir_str = str(config.install_dir)
         linked_dotfiles = []
 
-        for dotfile in dotfiles:
-            path = home / dotfile
-            if path.is_symlink():
-                target = path.resolve()
-                if str(config.install_dir) in str(target):
-                    linked_dotfiles.append(dotfile)
+        for dotfile in config.dotfiles:
+            # Only the link's own target matters, not the fully resolved path
+            try:
+                target = os.readlink(home / dotfile)
+            except OSError:
+                # Missing or not a symlink
+                continue
+
+            if install_dir_str in os.path.normpath(os.path.join(home, target)):
+                linked_dotfiles.append(dotfile)
 
         if linked_dotfiles:
             click.echo(f"\nLinked dotfiles: {', '.join(linked_dotfiles)}")
 
         # Check for scripts
         if config.bin_dir.exists():
-            scripts = list(config.bin_dir.glob("*"))
-            click.echo(f"\nScripts in ~/bin: {len(scripts)}")
+            with os.scandir(config.bin_dir) as entries:
+                num_scripts = sum(1 for _ in entries)
+            click.echo(f"\nScripts in ~/bin: {num_scripts}")
 
     else:
         click.secho(f"\n✗ Not installed (expected at: {config.install_dir})", fg="red")
 
-    click.echo("\n" + "=" * 60)
+    click.echo("\n" + _RULE)
 
 
 @cli.command()
 def info() -> None:
     """Show system information."""
-    from environment_configurator.utils.shell_utils import (
-        detect_shell,
-        check_python_version,
-        get_terminal_size,
-    )
-
-    click.echo("\n" + "=" * 60)
-    click.echo("System Information")
-    click.echo("=" * 60)
+    click.echo(f"\n{_RULE}\nSystem Information\n{_RULE}")
 
     # Python version
     major, minor, micro = check_python_version()
@@ -210,12 +223,12 @@ def info() -> None:
     # Home directory
     click.echo(f"Home: {Path.home()}")
 
-    click.echo("\n" + "=" * 60)
+    click.echo("\n" + _RULE)
 
 
 def main() -> None:
     """Main entry point."""
-    cli(obj={})
+    cli()
 
 
 if __name__ == "__main__":
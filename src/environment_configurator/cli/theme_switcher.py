@@ -4,22 +4,45 @@ CLI for tmux theme switcher.
 Provides command-line interface for browsing and applying tmux themes.
 """
 
+from __future__ import annotations
+
+import functools
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Sequence
 
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 
 from environment_configurator import __version__
+from environment_configurator.cli.context import CLIContext
 from environment_configurator.utils.logger import setup_logging, get_logger
-from environment_configurator.tmux.theme_manager import ThemeManager
-from environment_configurator.tmux.theme_applier import ThemeApplier
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from environment_configurator.tmux.models import Theme
+    from environment_configurator.tmux.theme_manager import ThemeManager
 
 logger = get_logger(__name__)
-console = Console()
+
+
+# rich and the theme modules are imported by the commands that use them, so
+# `--help` and `--version` don't pay for loading them.
+@functools.lru_cache(maxsize=1)
+def _get_console() -> Console:
+    """Return the shared rich console, creating it on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_manager() -> ThemeManager:
+    """Return the shared theme manager, loading the theme catalog on first use."""
+    from environment_configurator.tmux.theme_manager import ThemeManager
+
+    return ThemeManager()
 
 
 @click.group()
@@ -28,24 +51,24 @@ console = Console()
 @click.pass_context
 def cli(ctx: click.Context, verbose: bool) -> None:
     """Tmux Theme Switcher - Manage your tmux color themes."""
-    ctx.ensure_object(dict)
-
     # Setup logging
     log_level = logging.DEBUG if verbose else logging.INFO
     setup_logging(log_level=log_level, verbose=verbose, enable_file_logging=False)
 
-    ctx.obj["verbose"] = verbose
+    ctx.obj = CLIContext(verbose=verbose)
 
 
 @cli.command()
 @click.option("--category", "-c", help="Filter by category")
 @click.option("--search", "-s", help="Search themes by name or description")
-@click.pass_context
-def list(ctx: click.Context, category: str, search: str) -> None:
+def list(category: str, search: str) -> None:
     """List available themes."""
-    manager = ThemeManager()
+    console = _get_console()
+
+    manager = _get_manager()
 
     # Get themes based on filters
+    themes: Sequence[Theme]
     if search:
         themes = manager.search_themes(search)
         title = f"Search Results for '{search}'"
@@ -60,6 +83,20 @@ def list(ctx: click.Context, category: str, search: str) -> None:
         console.print("[yellow]No themes found.[/yellow]")
         return
 
+    if not console.is_terminal:
+        # Piped output: plain aligned columns, easy to grep/cut/fzf
+        name_width = max(len(theme.name) for theme in themes)
+        category_width = max(len(theme.category) for theme in themes)
+        lines = []
+        for theme in themes:
+            name = theme.name.ljust(name_width)
+            category = theme.category.ljust(category_width)
+            lines.append(f"{name}  {category}  {theme.description}")
+        click.echo("\n".join(lines))
+        return
+
+    from rich.table import Table
+
     # Create table
     table = Table(title=title, show_header=True, header_style="bold magenta")
     table.add_column("Name", style="cyan", no_wrap=True)
@@ -74,10 +111,13 @@ def list(ctx: click.Context, category: str, search: str) -> None:
 
 
 @cli.command()
-@click.pass_context
-def categories(ctx: click.Context) -> None:
+def categories() -> None:
     """List theme categories."""
-    manager = ThemeManager()
+    from rich.table import Table
+
+    console = _get_console()
+
+    manager = _get_manager()
     categories_list = manager.get_categories()
 
     table = Table(title="Theme Categories", show_header=True, header_style="bold magenta")
@@ -93,10 +133,13 @@ def categories(ctx: click.Context) -> None:
 
 @cli.command()
 @click.argument("theme_name")
-@click.pass_context
-def preview(ctx: click.Context, theme_name: str) -> None:
+def preview(theme_name: str) -> None:
     """Preview a theme's colors."""
-    manager = ThemeManager()
+    from rich.panel import Panel
+
+    console = _get_console()
+
+    manager = _get_manager()
     theme = manager.get_theme_by_name(theme_name)
 
     if not theme:
@@ -132,10 +175,13 @@ Description: {theme.description}
 @click.argument("theme_name")
 @click.option("--no-backup", is_flag=True, help="Don't create backups")
 @click.option("--force", "-f", is_flag=True, help="Apply without confirmation")
-@click.pass_context
-def apply(ctx: click.Context, theme_name: str, no_backup: bool, force: bool) -> None:
+def apply(theme_name: str, no_backup: bool, force: bool) -> None:
     """Apply a theme to tmux and shell."""
-    manager = ThemeManager()
+    from environment_configurator.tmux.theme_applier import ThemeApplier
+
+    console = _get_console()
+
+    manager = _get_manager()
     theme = manager.get_theme_by_name(theme_name)
 
     if not theme:
@@ -182,9 +228,12 @@ def apply(ctx: click.Context, theme_name: str, no_backup: bool, force: bool) ->
 
 
 @cli.command()
-@click.pass_context
-def current(ctx: click.Context) -> None:
+def current() -> None:
     """Show the currently applied theme."""
+    from environment_configurator.tmux.theme_applier import ThemeApplier
+
+    console = _get_console()
+
     applier = ThemeApplier()
     theme_name = applier.get_current_theme_name()
 
@@ -192,7 +241,7 @@ def current(ctx: click.Context) -> None:
         console.print(f"\n[bold green]Current theme:[/bold green] {theme_name}")
 
         # Try to get theme details
-        manager = ThemeManager()
+        manager = _get_manager()
         theme = manager.get_theme_by_name(theme_name)
 
         if theme:
@@ -202,9 +251,10 @@ def current(ctx: click.Context) -> None:
 
 
 @cli.command()
-@click.pass_context
-def interactive(ctx: click.Context) -> None:
+def interactive() -> None:
     """Launch the interactive TUI (original theme switcher)."""
+    console = _get_console()
+
     try:
         import curses
         from pathlib import Path
@@ -215,9 +265,11 @@ def interactive(ctx: click.Context) -> None:
 
         if original_script.exists():
             console.print("[cyan]Launching interactive theme switcher...[/cyan]")
-            # Execute the original script
-            import subprocess
-            subprocess.run([sys.executable, str(original_script)])
+            # Execute the original script in this interpreter
+            import runpy
+
+            sys.argv = [str(original_script)]
+            runpy.run_path(str(original_script), run_name="__main__")
         else:
             console.print("[yellow]Interactive TUI not available in this version.[/yellow]")
             console.print("[dim]Use the 'list', 'preview', and 'apply' commands instead.[/dim]")
@@ -228,10 +280,11 @@ def interactive(ctx: click.Context) -> None:
 
 
 @cli.command()
-@click.pass_context
-def stats(ctx: click.Context) -> None:
+def stats() -> None:
     """Show theme statistics."""
-    manager = ThemeManager()
+    console = _get_console()
+
+    manager = _get_manager()
 
     console.print("\n[bold cyan]Theme Statistics[/bold cyan]")
     console.print(f"Total themes: {manager.get_theme_count()}")
@@ -248,7 +301,7 @@ def stats(ctx: click.Context) -> None:
 
 def main() -> None:
     """Main entry point."""
-    cli(obj={})
+    cli()
 
 
 if __name__ == "__main__":
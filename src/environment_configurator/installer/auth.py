@@ -4,16 +4,44 @@ Git authentication management.
 Handles authentication for private repositories using tokens or credentials.
 """
 
+import functools
 import getpass
+import os
 from pathlib import Path
 from typing import Optional, Tuple
-from urllib.parse import urlparse
+from urllib.parse import quote, urlparse
 
 from environment_configurator.utils.logger import get_logger
 from environment_configurator.utils.shell_utils import run_command
 
 logger = get_logger(__name__)
 
+# Environment variables checked for a GitHub token before prompting
+TOKEN_ENV_VARS = ("GITHUB_TOKEN", "GH_TOKEN")
+
+
+@functools.lru_cache(maxsize=None)
+def _probe_public(repo_url: str) -> bool:
+    """
+    Check whether a repository can be read without credentials.
+
+    Cached per URL for the life of the process; a probe that raises is not
+    cached and will be retried.
+
+    Args:
+        repo_url: The repository URL
+
+    Returns:
+        True if `git ls-remote` succeeds anonymously
+    """
+    returncode, _, _ = run_command(
+        ["git", "ls-remote", repo_url, "HEAD"],
+        check=False,
+        capture_output=True,
+        timeout=10,
+    )
+    return returncode == 0
+
 
 class GitAuthenticator:
     """Manages Git authentication for repository access."""
@@ -28,33 +56,45 @@ class GitAuthenticator:
         """
         self.repo_url = repo_url
         self.use_password = use_password
+
+        # Parsed once; credentials are spliced in front of the host
+        parsed = urlparse(repo_url)
+        self._netloc = parsed.netloc
+        self._path = parsed.path
         self.authenticated_url: Optional[str] = None
+        self._is_public: Optional[bool] = None
 
     def is_public_repo(self) -> bool:
         """
         Check if the repository is publicly accessible.
 
+        The result is cached, so the network probe runs at most once per
+        repository URL in a process.
+
         Returns:
             True if repository is public, False otherwise
         """
+        if self._is_public is not None:
+            return self._is_public
+
         try:
-            returncode, _, _ = run_command(
-                ["git", "ls-remote", self.repo_url, "HEAD"],
-                check=False,
-                capture_output=True,
-                timeout=10,
-            )
-            is_public = returncode == 0
-            logger.info(f"Repository is {'public' if is_public else 'private'}")
-            return is_public
+            self._is_public = _probe_public(self.repo_url)
+            logger.info(f"Repository is {'public' if self._is_public else 'private'}")
         except Exception as e:
             logger.warning(f"Could not check repository accessibility: {e}")
-            return False
+            self._is_public = False
+
+        return self._is_public
 
     def get_authenticated_url(self) -> str:
         """
         Get an authenticated URL for the repository.
 
+        A public repository is always cloned by its plain URL, so a token
+        never ends up in the clone's .git/config unless it is needed. For a
+        private repository, a token from GITHUB_TOKEN or GH_TOKEN is used
+        before prompting.
+
         Returns:
             Authenticated repository URL
 
@@ -70,6 +110,11 @@ class GitAuthenticator:
         # Private repo - need authentication
         logger.info("Repository is private, authentication required")
 
+        token = next((os.environ[var] for var in TOKEN_ENV_VARS if os.environ.get(var)), None)
+        if token:
+            logger.info("Using GitHub token from environment")
+            return self._build_token_url(token)
+
         if self.use_password:
             return self._get_password_auth_url()
         else:
@@ -100,9 +145,20 @@ class GitAuthenticator:
         if not token:
             raise ValueError("Token cannot be empty")
 
-        # Parse URL and insert token
-        parsed = urlparse(self.repo_url)
-        authenticated_url = f"https://{token}@{parsed.netloc}{parsed.path}"
+        return self._build_token_url(token)
+
+    def _build_token_url(self, token: str) -> str:
+        """
+        Build and store a token-authenticated URL.
+
+        Args:
+            token: GitHub Personal Access Token
+
+        Returns:
+            URL with token authentication
+        """
+        # Insert token, escaped so characters like '@' or '/' can't break the URL
+        authenticated_url = f"https://{quote(token, safe='')}@{self._netloc}{self._path}"
 
         self.authenticated_url = authenticated_url
         logger.info("Token authentication configured")
@@ -130,9 +186,11 @@ class GitAuthenticator:
         if not username or not password:
             raise ValueError("Username and password cannot be empty")
 
-        # Parse URL and insert credentials
-        parsed = urlparse(self.repo_url)
-        authenticated_url = f"https://{username}:{password}@{parsed.netloc}{parsed.path}"
+        # Insert credentials, escaped so characters like '@' or ':' can't break the URL
+        authenticated_url = (
+            f"https://{quote(username, safe='')}:{quote(password, safe='')}"
+            f"@{self._netloc}{self._path}"
+        )
 
         self.authenticated_url = authenticated_url
         logger.info("Password authentication configured")
@@ -167,6 +225,10 @@ class GitAuthenticator:
         if not self.authenticated_url:
             return False, "No authenticated URL configured"
 
+        # A public repository was already reached with this URL by the probe
+        if self.authenticated_url == self.repo_url and self._is_public:
+            return True, "Authentication successful"
+
         try:
             returncode, stdout, stderr = run_command(
                 ["git", "ls-remote", self.authenticated_url, "HEAD"],
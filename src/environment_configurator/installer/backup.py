@@ -4,16 +4,59 @@ Backup management for environment configurator.
 Handles creating, managing, and restoring backups of configuration files.
 """
 
+import os
 import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import List, Optional
+from types import TracebackType
+from typing import Any, Callable, List, Optional, Tuple, Type
 
 from environment_configurator.utils.logger import get_logger
 from environment_configurator.utils.file_utils import ensure_directory
 
 logger = get_logger(__name__)
 
+# Below this many files, thread pool startup costs more than it saves
+_PARALLEL_BACKUP_MIN_FILES = 3
+_MAX_BACKUP_WORKERS = 8
+
+# Dotfiles in the home directory saved by backup_dotfiles()
+BACKUP_DOTFILES = (".bashrc", ".zshrc", ".gitconfig", ".tmux.conf", ".profile")
+
+
+def _rmtree_collecting(path: str) -> List[Tuple[str, BaseException]]:
+    """
+    Remove a directory tree, carrying on past entries that can't be removed.
+
+    Args:
+        path: The directory to remove
+
+    Returns:
+        List of (path, error) pairs for everything that could not be removed
+    """
+    errors: List[Tuple[str, BaseException]] = []
+
+    def _onexc(func: Callable[..., Any], failed: str, exc: BaseException) -> None:
+        errors.append((failed, exc))
+
+    def _onerror(
+        func: Callable[..., Any],
+        failed: str,
+        exc_info: Tuple[Type[BaseException], BaseException, Optional[TracebackType]],
+    ) -> None:
+        errors.append((failed, exc_info[1]))
+
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_onexc)
+    else:
+        shutil.rmtree(path, onerror=_onerror)
+
+    return errors
+
 
 class BackupManager:
     """Manages backups of configuration files."""
@@ -26,15 +69,17 @@ class BackupManager:
             backup_dir: Directory for backups (auto-generated if not provided)
         """
         if backup_dir is None:
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            timestamp = time.strftime("%Y%m%d-%H%M%S")
             backup_dir = Path.home() / f".environment-config-backup-{timestamp}"
 
         self.backup_dir = backup_dir
         self.backed_up_files: List[Path] = []
+        self._backup_dir_ready = False
 
     def create_backup_directory(self) -> None:
         """Create the backup directory if it doesn't exist."""
         ensure_directory(self.backup_dir)
+        self._backup_dir_ready = True
         logger.info(f"Backup directory: {self.backup_dir}")
 
     def backup_file(self, file_path: Path) -> Optional[Path]:
@@ -51,13 +96,31 @@ class BackupManager:
             logger.debug(f"File doesn't exist, skipping backup: {file_path}")
             return None
 
-        self.create_backup_directory()
+        # Only created once, and only when there is something to back up
+        if not self._backup_dir_ready:
+            self.create_backup_directory()
+
+        backup_path = self._copy_to_backup(file_path)
+        self.backed_up_files.append(backup_path)
+        return backup_path
+
+    def _copy_to_backup(self, file_path: Path) -> Path:
+        """
+        Copy a file into the (existing) backup directory.
+
+        Args:
+            file_path: The file to backup
+
+        Returns:
+            Path to the backup file
 
+        Raises:
+            OSError: If the copy fails
+        """
         backup_path = self.backup_dir / file_path.name
 
         try:
             shutil.copy2(file_path, backup_path)
-            self.backed_up_files.append(backup_path)
             logger.info(f"Backed up: {file_path} -> {backup_path}")
             return backup_path
 
@@ -69,18 +132,34 @@ class BackupManager:
         """
         Backup multiple files.
 
+        The copies are independent and mostly wait on the filesystem, so
+        batches are copied on a small thread pool.
+
         Args:
             file_paths: List of files to backup
 
         Returns:
             List of backup file paths (excludes files that didn't exist)
         """
-        backed_up = []
-
+        existing = []
         for file_path in file_paths:
-            backup_path = self.backup_file(file_path)
-            if backup_path:
-                backed_up.append(backup_path)
+            if file_path.exists():
+                existing.append(file_path)
+            else:
+                logger.debug(f"File doesn't exist, skipping backup: {file_path}")
+
+        if existing and not self._backup_dir_ready:
+            self.create_backup_directory()
+
+        if len(existing) < _PARALLEL_BACKUP_MIN_FILES:
+            backed_up = [self._copy_to_backup(file_path) for file_path in existing]
+        else:
+            workers = min(_MAX_BACKUP_WORKERS, len(existing))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                backed_up = list(executor.map(self._copy_to_backup, existing))
+
+        # Recorded here rather than in the workers, keeping the input order
+        self.backed_up_files.extend(backed_up)
 
         logger.info(f"Backed up {len(backed_up)} files to {self.backup_dir}")
         return backed_up
@@ -93,15 +172,7 @@ class BackupManager:
             List of backed up file paths
         """
         home = Path.home()
-        dotfiles = [
-            home / ".bashrc",
-            home / ".zshrc",
-            home / ".gitconfig",
-            home / ".tmux.conf",
-            home / ".profile",
-        ]
-
-        return self.backup_files(dotfiles)
+        return self.backup_files([home / name for name in BACKUP_DOTFILES])
 
     def restore_file(self, backup_path: Path, restore_to: Optional[Path] = None) -> None:
         """
@@ -138,11 +209,23 @@ class BackupManager:
         Returns:
             List of backup file paths
         """
-        if not self.backup_dir.exists():
+        return [Path(entry.path) for entry in self._scan_backups()]
+
+    def _scan_backups(self) -> List[os.DirEntry]:
+        """
+        Scan the backup directory for files.
+
+        Returns:
+            Directory entries of the backup files, sorted by name
+        """
+        try:
+            with os.scandir(self.backup_dir) as entries:
+                backups = [entry for entry in entries if entry.is_file()]
+        except FileNotFoundError:
             return []
 
-        backups = sorted(self.backup_dir.glob("*"))
-        return [b for b in backups if b.is_file()]
+        backups.sort(key=attrgetter("name"))
+        return backups
 
     def get_backup_info(self) -> dict:
         """
@@ -151,18 +234,21 @@ class BackupManager:
         Returns:
             Dictionary with backup information
         """
-        backups = self.list_backups()
+        backups = self._scan_backups()
+        total_bytes = sum(b.stat().st_size for b in backups)
+
+        # One stat for both the existence check and the creation time
+        try:
+            created = datetime.fromtimestamp(self.backup_dir.stat().st_ctime).isoformat()
+        except FileNotFoundError:
+            created = None
 
         return {
             "backup_dir": str(self.backup_dir),
             "num_files": len(backups),
             "files": [b.name for b in backups],
-            "total_size_mb": sum(b.stat().st_size for b in backups) / (1024 * 1024),
-            "created": (
-                datetime.fromtimestamp(self.backup_dir.stat().st_ctime).isoformat()
-                if self.backup_dir.exists()
-                else None
-            ),
+            "total_size_mb": total_bytes / (1024 * 1024),
+            "created": created,
         }
 
     def cleanup_old_backups(self, keep_last: int = 5) -> int:
@@ -176,26 +262,30 @@ class BackupManager:
             Number of backup directories deleted
         """
         backup_parent = Path.home()
-        backup_pattern = ".environment-config-backup-*"
-
-        # Find all backup directories
-        backup_dirs = sorted(
-            [d for d in backup_parent.glob(backup_pattern) if d.is_dir()],
-            key=lambda d: d.stat().st_ctime,
-            reverse=True,
-        )
+        backup_prefix = ".environment-config-backup-"
+
+        # Find all backup directories in a single directory scan; DirEntry
+        # knows the entry type from the scan itself
+        with os.scandir(backup_parent) as entries:
+            backup_dirs = [
+                (entry.stat(follow_symlinks=False).st_ctime, entry.path)
+                for entry in entries
+                if entry.name.startswith(backup_prefix) and entry.is_dir(follow_symlinks=False)
+            ]
+        backup_dirs.sort(key=itemgetter(0), reverse=True)
 
         # Keep only the most recent ones
         to_delete = backup_dirs[keep_last:]
         deleted_count = 0
 
-        for backup_dir in to_delete:
-            try:
-                shutil.rmtree(backup_dir)
+        for _, backup_dir in to_delete:
+            errors = _rmtree_collecting(backup_dir)
+            if errors:
+                for path, error in errors:
+                    logger.warning(f"Could not delete backup {backup_dir}: {path}: {error}")
+            else:
                 logger.info(f"Deleted old backup: {backup_dir}")
                 deleted_count += 1
-            except OSError as e:
-                logger.warning(f"Could not delete backup {backup_dir}: {e}")
 
         if deleted_count > 0:
             logger.info(f"Cleaned up {deleted_count} old backup directories")
@@ -4,23 +4,32 @@ Configuration management for the installer.
 Centralized configuration for repository URLs, paths, and settings.
 """
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Optional
 
+from environment_configurator.utils.compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class InstallerConfig:
-    """Configuration for the environment installer."""
+    """
+    Configuration for the environment installer.
+
+    The config is frozen once created; use dataclasses.replace() to derive a
+    changed copy.
+    """
 
     # Repository settings
     repo_url: str = "https://github.com/builderOfTheWorlds/environmentConfigurator.git"
     repo_branch: str = "main"
+    shallow_clone: bool = True  # Only the latest snapshot is needed
+    clone_depth: int = 1
 
     # Installation paths
     install_dir: Path = Path.home() / ".environment-config"
     bin_dir: Path = Path.home() / "bin"
-    backup_dir: Optional[Path] = None  # Will be set dynamically
+    backup_dir: Optional[Path] = None  # Timestamped directory chosen by BackupManager
 
     # Dotfiles to install
     dotfiles: list[str] = None  # type: ignore
@@ -47,31 +56,21 @@ class InstallerConfig:
     def __post_init__(self) -> None:
         """Initialize default values after dataclass creation."""
         if self.dotfiles is None:
-            self.dotfiles = [
-                ".bashrc",
-                ".zshrc",
-                ".gitconfig",
-                ".tmux.conf",
-            ]
-
-        if self.backup_dir is None:
-            from datetime import datetime
-
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-            self.backup_dir = Path.home() / f".environment-config-backup-{timestamp}"
+            # Frozen dataclass: bypass the generated __setattr__
+            object.__setattr__(
+                self,
+                "dotfiles",
+                [
+                    ".bashrc",
+                    ".zshrc",
+                    ".gitconfig",
+                    ".tmux.conf",
+                ],
+            )
 
     def to_dict(self) -> dict:
-        """Convert config to dictionary."""
+        """Convert config to dictionary, with paths as strings."""
         return {
-            "repo_url": self.repo_url,
-            "repo_branch": self.repo_branch,
-            "install_dir": str(self.install_dir),
-            "bin_dir": str(self.bin_dir),
-            "backup_dir": str(self.backup_dir),
-            "dotfiles": self.dotfiles,
-            "scripts_enabled": self.scripts_enabled,
-            "fonts_enabled": self.fonts_enabled,
-            "auto_update_enabled": self.auto_update_enabled,
-            "test_mode": self.test_mode,
-            "verbose": self.verbose,
+            key: str(value) if isinstance(value, Path) else value
+            for key, value in asdict(self).items()
         }
@@ -4,15 +4,40 @@ Cron job management for auto-updates.
 Handles creation and management of cron jobs for automatic environment updates.
 """
 
+import functools
 import re
+import subprocess
 from pathlib import Path
 from typing import List, Optional
 
 from environment_configurator.utils.logger import get_logger
-from environment_configurator.utils.shell_utils import is_command_available, run_command
+from environment_configurator.utils.shell_utils import (
+    is_command_available_cached,
+    run_command,
+)
 
 logger = get_logger(__name__)
 
+# Comment line written above the auto-update job
+_JOB_COMMENT = "# Environment configurator auto-update"
+# Matches our comment lines (ignoring indentation) without stripping each line
+_JOB_COMMENT_RE = re.compile(r"\s*# Environment configurator")
+
+
+@functools.lru_cache(maxsize=8)
+def _auto_update_job_re(install_dir_str: str) -> "re.Pattern[str]":
+    """
+    Build the pattern matching auto-update job lines for an install directory.
+
+    Args:
+        install_dir_str: The installation directory
+
+    Returns:
+        Compiled pattern matching lines that run `git pull` in the directory
+    """
+    install_dir_re = re.escape(install_dir_str)
+    return re.compile(rf"{install_dir_re}.*git pull|git pull.*{install_dir_re}")
+
 
 class CronManager:
     """Manages cron jobs for environment configurator."""
@@ -25,25 +50,38 @@ class CronManager:
             test_mode: Whether running in test mode (no actual changes)
         """
         self.test_mode = test_mode
+        self._crontab_cache: Optional[List[str]] = None
 
     def is_cron_available(self) -> bool:
         """
         Check if cron is available on the system.
 
+        This is a PATH lookup (shutil.which), done once per process.
+
         Returns:
             True if cron is available, False otherwise
         """
-        available = is_command_available("crontab")
+        available = is_command_available_cached("crontab")
         logger.debug(f"Cron available: {available}")
         return available
 
+    def invalidate_cache(self) -> None:
+        """Forget the cached crontab, e.g. after it was changed outside this manager."""
+        self._crontab_cache = None
+
     def get_current_crontab(self) -> List[str]:
         """
         Get the current user's crontab entries.
 
+        The crontab is read once and cached; writes made through this manager
+        keep the cache up to date.
+
         Returns:
             List of crontab lines
         """
+        if self._crontab_cache is not None:
+            return list(self._crontab_cache)
+
         if not self.is_cron_available():
             return []
 
@@ -55,10 +93,12 @@ class CronManager:
             )
 
             if returncode == 0:
-                return [line for line in stdout.split("\n") if line.strip()]
+                self._crontab_cache = [line for line in stdout.splitlines() if line.strip()]
+                return list(self._crontab_cache)
             else:
                 # No crontab yet (this is normal)
                 if "no crontab" in stderr.lower():
+                    self._crontab_cache = []
                     return []
                 else:
                     logger.warning(f"Error reading crontab: {stderr}")
@@ -79,10 +119,10 @@ class CronManager:
             True if auto-update job exists, False otherwise
         """
         crontab = self.get_current_crontab()
-        install_dir_str = str(install_dir)
+        job_re = _auto_update_job_re(str(install_dir))
 
         for line in crontab:
-            if install_dir_str in line and "git pull" in line:
+            if job_re.search(line):
                 logger.debug(f"Found existing auto-update job: {line}")
                 return True
 
@@ -118,27 +158,19 @@ class CronManager:
             return True
 
         try:
-            # Get current crontab
-            current_crontab = self.get_current_crontab()
+            # Get current crontab (already our own copy, so extend it in place)
+            new_crontab = self.get_current_crontab()
 
             # Add new job
-            comment = "# Environment configurator auto-update"
-            job = f"{schedule} cd {install_dir} && git pull origin {branch} > /dev/null 2>&1"
-
-            new_crontab = current_crontab + [comment, job]
+            new_crontab.append(_JOB_COMMENT)
+            new_crontab.append(
+                f"{schedule} cd {install_dir} && git pull origin {branch} > /dev/null 2>&1"
+            )
 
-            # Write new crontab
+            # Write new crontab, ending with a newline
             crontab_content = "\n".join(new_crontab) + "\n"
 
-            process = run_command(
-                ["crontab", "-"],
-                check=True,
-                capture_output=True,
-            )
-
             # Feed the crontab content via stdin
-            import subprocess
-
             subprocess.run(
                 ["crontab", "-"],
                 input=crontab_content,
@@ -146,6 +178,7 @@ class CronManager:
                 check=True,
                 capture_output=True,
             )
+            self._crontab_cache = new_crontab
 
             logger.info(f"Added auto-update cron job: {schedule}")
             return True
@@ -174,14 +207,13 @@ class CronManager:
 
         try:
             current_crontab = self.get_current_crontab()
-            install_dir_str = str(install_dir)
+            job_re = _auto_update_job_re(str(install_dir))
 
-            # Filter out auto-update jobs
+            # Filter out auto-update jobs and their comment lines
             new_crontab = [
                 line
                 for line in current_crontab
-                if not (install_dir_str in line and "git pull" in line)
-                and not line.strip().startswith("# Environment configurator")
+                if not (job_re.search(line) or _JOB_COMMENT_RE.match(line))
             ]
 
             if len(new_crontab) == len(current_crontab):
@@ -191,8 +223,6 @@ class CronManager:
             # Write new crontab
             if new_crontab:
                 crontab_content = "\n".join(new_crontab) + "\n"
-                import subprocess
-
                 subprocess.run(
                     ["crontab", "-"],
                     input=crontab_content,
@@ -203,6 +233,7 @@ class CronManager:
             else:
                 # Remove crontab entirely if empty
                 subprocess.run(["crontab", "-r"], check=True, capture_output=True)
+            self._crontab_cache = new_crontab
 
             logger.info("Removed auto-update cron job")
             return True
@@ -4,14 +4,21 @@ Dotfile management for environment configurator.
 Handles installation and management of dotfiles via symlinks.
 """
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Set
 
 from environment_configurator.utils.logger import get_logger
 from environment_configurator.utils.file_utils import create_symlink, backup_file
 
 logger = get_logger(__name__)
 
+# Below this many dotfiles, thread pool startup costs more than it saves
+_PARALLEL_INSTALL_MIN_FILES = 3
+_MAX_INSTALL_WORKERS = 8
+
 
 class DotfileManager:
     """Manages installation of dotfiles."""
@@ -26,7 +33,8 @@ class DotfileManager:
         """
         self.source_dir = source_dir / "dotfiles"
         self.test_mode = test_mode
-        self.installed_files: List[Path] = []
+        self.installed_files: Set[Path] = set()
+        self._installed_lock = threading.Lock()
 
     def get_dotfiles(self) -> List[Path]:
         """
@@ -35,35 +43,30 @@ class DotfileManager:
         Returns:
             List of dotfile paths
         """
-        if not self.source_dir.exists():
+        # Hidden files (start with .) and regular files (installed with a
+        # . prefix) in a single directory scan
+        try:
+            with os.scandir(self.source_dir) as entries:
+                dotfiles = [Path(entry.path) for entry in entries if entry.is_file()]
+        except FileNotFoundError:
             logger.warning(f"Dotfiles directory not found: {self.source_dir}")
             return []
 
-        dotfiles = []
-
-        # Hidden files (start with .)
-        for file_path in self.source_dir.glob(".*"):
-            if file_path.is_file() and file_path.name not in (".", ".."):
-                dotfiles.append(file_path)
-
-        # Regular files (will be installed with . prefix)
-        for file_path in self.source_dir.glob("*"):
-            if file_path.is_file():
-                dotfiles.append(file_path)
+        # Keep hidden files ahead of regular ones
+        dotfiles.sort(key=lambda path: not path.name.startswith("."))
 
         logger.debug(f"Found {len(dotfiles)} dotfiles")
         return dotfiles
 
-    def install_dotfile(self, source_file: Path, backup: bool = True) -> bool:
+    def _target_path(self, source_file: Path) -> Path:
         """
-        Install a single dotfile via symlink.
+        Get the path in the home directory a dotfile is linked from.
 
         Args:
-            source_file: The source dotfile to install
-            backup: Whether to backup existing file
+            source_file: The source dotfile
 
         Returns:
-            True if installed successfully, False otherwise
+            The target path for the symlink
         """
         home = Path.home()
 
@@ -71,9 +74,21 @@ class DotfileManager:
         filename = source_file.name
         if not filename.startswith(".") and source_file.parent.name == "dotfiles":
             # Regular filename in dotfiles dir -> add dot prefix
-            target_path = home / f".{filename}"
-        else:
-            target_path = home / filename
+            return home / f".{filename}"
+        return home / filename
+
+    def install_dotfile(self, source_file: Path, backup: bool = True) -> bool:
+        """
+        Install a single dotfile via symlink.
+
+        Args:
+            source_file: The source dotfile to install
+            backup: Whether to backup existing file
+
+        Returns:
+            True if installed successfully, False otherwise
+        """
+        target_path = self._target_path(source_file)
 
         # Test mode - just log what would happen
         if self.test_mode:
@@ -91,7 +106,8 @@ class DotfileManager:
         # Create symlink
         try:
             create_symlink(source_file, target_path, force=True, backup=False)
-            self.installed_files.append(target_path)
+            with self._installed_lock:
+                self.installed_files.add(target_path)
             logger.info(f"Installed: {target_path} -> {source_file}")
             return True
 
@@ -115,11 +131,24 @@ class DotfileManager:
             logger.warning("No dotfiles found to install")
             return 0
 
-        success_count = 0
-
+        # Both "bashrc" and ".bashrc" link ~/.bashrc, so dotfiles are grouped
+        # by target and each group is installed in get_dotfiles() order (the
+        # regular file last, so it wins). Different targets are independent.
+        groups: Dict[Path, List[Path]] = {}
         for dotfile in dotfiles:
-            if self.install_dotfile(dotfile, backup=backup):
-                success_count += 1
+            groups.setdefault(self._target_path(dotfile), []).append(dotfile)
+
+        def install(group: List[Path]) -> int:
+            return sum(self.install_dotfile(dotfile, backup=backup) for dotfile in group)
+
+        if len(groups) < _PARALLEL_INSTALL_MIN_FILES:
+            results = [install(group) for group in groups.values()]
+        else:
+            workers = min(_MAX_INSTALL_WORKERS, len(groups))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(install, groups.values()))
+
+        success_count = sum(results)
 
         logger.info(f"Installed {success_count}/{len(dotfiles)} dotfiles")
         return success_count
@@ -159,6 +188,6 @@ class DotfileManager:
         Get list of currently installed dotfiles.
 
         Returns:
-            List of installed dotfile paths (symlinks)
+            Sorted list of installed dotfile paths (symlinks)
         """
-        return self.installed_files.copy()
+        return sorted(self.installed_files)
@@ -4,16 +4,28 @@ Font installation management.
 Handles installation of Nerd Fonts for terminal theming.
 """
 
-import zipfile
-from pathlib import Path
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
 from typing import Optional
 
 from environment_configurator.utils.logger import get_logger
 from environment_configurator.utils.file_utils import ensure_directory
-from environment_configurator.utils.shell_utils import is_command_available, run_command
+from environment_configurator.utils.shell_utils import (
+    is_command_available_cached,
+    run_command,
+)
 
 logger = get_logger(__name__)
 
+# Fonts are a few MB each; copy them in large chunks rather than 8 KB reads
+_COPY_BUFFER_SIZE = 1 << 20
+_MAX_FONT_WORKERS = 8
+
+_FONT_EXTENSIONS = (".ttf", ".otf")
+
 
 class FontInstaller:
     """Manages installation of fonts."""
@@ -49,11 +61,11 @@ class FontInstaller:
         """
         missing_tools = []
 
-        if not is_command_available("unzip"):
+        if not is_command_available_cached("unzip"):
             missing_tools.append("unzip")
             logger.warning("unzip is not installed - required for font installation")
 
-        if not is_command_available("fc-cache"):
+        if not is_command_available_cached("fc-cache"):
             logger.warning(
                 "fontconfig is not installed - font cache will not be updated automatically"
             )
@@ -77,36 +89,76 @@ class FontInstaller:
         Returns:
             True if installation successful, False otherwise
         """
+        return self._extract_fonts(zip_path) is not None
+
+    def _extract_fonts(self, zip_path: Path) -> Optional[int]:
+        """
+        Extract the fonts from a ZIP archive into the fonts directory.
+
+        Args:
+            zip_path: Path to the font ZIP file
+
+        Returns:
+            Number of font files that were new or changed (by size or
+            modification time), or None if the extraction failed
+        """
         if not zip_path.exists():
             logger.error(f"Font ZIP not found: {zip_path}")
-            return False
+            return None
 
         if self.test_mode:
             logger.info(f"[TEST MODE] Would extract fonts from: {zip_path}")
-            return True
+            return 0
+
+        # Only needed once fonts are actually extracted
+        import zipfile
 
         # Create fonts directory
         ensure_directory(self.fonts_dir)
 
+        changed = 0
+
         try:
             # Extract fonts
             with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                # Extract only .ttf and .otf files
-                font_files = [
-                    f
-                    for f in zip_ref.namelist()
-                    if f.lower().endswith((".ttf", ".otf")) and not f.startswith("__MACOSX")
-                ]
-
-                for font_file in font_files:
-                    zip_ref.extract(font_file, self.fonts_dir)
+                created_dirs = {self.fonts_dir}
+                for member in zip_ref.infolist():
+                    # Extract only .ttf and .otf files
+                    name = member.filename
+                    if name.startswith("__MACOSX") or not name.lower().endswith(_FONT_EXTENSIONS):
+                        continue
+
+                    member_path = PurePosixPath(name)
+                    # Never write outside the fonts directory
+                    if member_path.is_absolute() or ".." in member_path.parts:
+                        logger.warning(f"Skipping unsafe font path in {zip_path.name}: {name}")
+                        continue
+
+                    target = self.fonts_dir.joinpath(*member_path.parts)
+                    if target.parent not in created_dirs:
+                        ensure_directory(target.parent)
+                        created_dirs.add(target.parent)
+
+                    # Extracted fonts carry the archive member's timestamp, so
+                    # a font is unchanged only if both size and mtime match
+                    mtime = time.mktime(member.date_time + (0, 0, -1))
+                    try:
+                        st = target.stat()
+                        if st.st_size != member.file_size or st.st_mtime != mtime:
+                            changed += 1
+                    except FileNotFoundError:
+                        changed += 1
+
+                    with zip_ref.open(member) as src, open(target, "wb") as dst:
+                        shutil.copyfileobj(src, dst, length=_COPY_BUFFER_SIZE)
+                    os.utime(target, (mtime, mtime))
 
             logger.info(f"Installed fonts from {zip_path.name}")
-            return True
+            return changed
 
         except Exception as e:
             logger.error(f"Failed to extract fonts from {zip_path}: {e}")
-            return False
+            return None
 
     def update_font_cache(self) -> bool:
         """
@@ -115,7 +167,7 @@ class FontInstaller:
         Returns:
             True if cache updated successfully, False otherwise
         """
-        if not is_command_available("fc-cache"):
+        if not is_command_available_cached("fc-cache"):
             logger.warning("fc-cache not available, skipping font cache update")
             return False
 
@@ -148,26 +200,40 @@ class FontInstaller:
             logger.warning("Prerequisites not met, skipping font installation")
             return False
 
-        if not self.source_dir.exists():
+        # Find all ZIP files in a single directory scan
+        try:
+            with os.scandir(self.source_dir) as entries:
+                font_zips = [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.lower().endswith(".zip") and entry.is_file()
+                ]
+        except FileNotFoundError:
             logger.warning(f"Font directory not found: {self.source_dir}")
             return False
 
-        # Find all ZIP files
-        font_zips = list(self.source_dir.glob("*.zip"))
-
         if not font_zips:
             logger.warning("No font ZIP files found")
             return False
 
-        success_count = 0
-
-        for font_zip in font_zips:
-            if self.install_from_zip(font_zip):
-                success_count += 1
-
-        # Update font cache if any fonts were installed
-        if success_count > 0:
+        # Each archive is opened and extracted independently, and zlib
+        # releases the GIL while decompressing, so extract them side by side
+        if len(font_zips) == 1:
+            results = [self._extract_fonts(font_zips[0])]
+        else:
+            workers = min(_MAX_FONT_WORKERS, len(font_zips))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._extract_fonts, font_zips))
+
+        installed = [changed for changed in results if changed is not None]
+        success_count = len(installed)
+
+        # A forced cache rebuild rescans every font, so only run it when
+        # something actually changed (a reinstall of the same fonts is a no-op)
+        if sum(installed) > 0 or (self.test_mode and success_count > 0):
             self.update_font_cache()
+        elif success_count > 0:
+            logger.info("Fonts already up to date, skipping font cache update")
 
         logger.info(f"Installed {success_count}/{len(font_zips)} font packages")
         return success_count > 0
@@ -179,14 +245,13 @@ class FontInstaller:
         Returns:
             List of installed font names
         """
-        if not self.fonts_dir.exists():
-            return []
-
-        fonts = []
-        for font_file in self.fonts_dir.rglob("*.ttf"):
-            fonts.append(font_file.stem)
-
-        for font_file in self.fonts_dir.rglob("*.otf"):
-            fonts.append(font_file.stem)
-
-        return sorted(set(fonts))
+        # A single walk over the tree; os.walk yields a missing directory
+        # as empty
+        fonts = set()
+        for _, _, files in os.walk(self.fonts_dir):
+            for name in files:
+                stem, ext = os.path.splitext(name)
+                if ext.lower() in _FONT_EXTENSIONS:
+                    fonts.add(stem)
+
+        return sorted(fonts)
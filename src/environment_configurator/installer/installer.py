@@ -4,12 +4,20 @@ Main installer orchestrator.
 Coordinates all installation components to set up the environment.
 """
 
+import os
 import shutil
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from environment_configurator.utils.logger import get_logger
-from environment_configurator.utils.shell_utils import check_git_installed, run_command
+from environment_configurator.utils.shell_utils import (
+    check_git_installed,
+    is_command_available_cached,
+    run_command,
+)
 from environment_configurator.installer.config import InstallerConfig
 from environment_configurator.installer.auth import GitAuthenticator
 from environment_configurator.installer.backup import BackupManager
@@ -68,6 +76,10 @@ class EnvironmentInstaller:
             logger.info("[TEST MODE] Would clone/update repository")
             return True
 
+        # The config is frozen, so these can be read once
+        install_dir = self.config.install_dir
+        branch = self.config.repo_branch
+
         # Initialize authenticator
         self.authenticator = GitAuthenticator(self.config.repo_url)
 
@@ -78,31 +90,68 @@ class EnvironmentInstaller:
             logger.error(f"Authentication failed: {e}")
             return False
 
-        # Clone or pull
-        if self.config.install_dir.exists():
-            logger.info(f"Updating existing installation at {self.config.install_dir}")
-            try:
-                run_command(
-                    ["git", "pull", "origin", self.config.repo_branch],
-                    cwd=self.config.install_dir,
-                    check=True,
+        # Clone or pull, depending on whether the directory is the top of a
+        # working tree already (not just inside one, e.g. a git-tracked home).
+        # A directory alone may be left over from an interrupted install.
+        is_repo = False
+
+        if install_dir.exists():
+            returncode, stdout, _ = run_command(
+                ["git", "-C", str(install_dir), "rev-parse", "--show-toplevel"],
+                check=False,
+                capture_output=True,
+                timeout=5,
+            )
+            is_repo = returncode == 0 and Path(stdout.strip()) == install_dir.resolve()
+
+            # git clones into an empty directory, but won't overwrite files
+            # (and neither will we)
+            if not is_repo and any(install_dir.iterdir()):
+                logger.error(
+                    f"{install_dir} exists but is not a git repository; "
+                    "remove it and run the installer again"
                 )
+                return False
+
+        if is_repo:
+            logger.info(f"Updating existing installation at {install_dir}")
+            pull_command = ["git", "pull", "origin", branch]
+
+            # A shallow clone can be pulled into as usual (git fetches the new
+            # commits on top of the shallow boundary), but a merge commit there
+            # would need history it doesn't have, so only fast-forward
+            if (install_dir / ".git" / "shallow").exists():
+                pull_command.insert(2, "--ff-only")
+
+            try:
+                run_command(pull_command, cwd=install_dir, check=True)
                 logger.info("Repository updated successfully")
             except Exception as e:
                 logger.error(f"Failed to update repository: {e}")
                 return False
         else:
-            logger.info(f"Cloning repository to {self.config.install_dir}")
+            logger.info(f"Cloning repository to {install_dir}")
+            clone_command = ["git", "clone"]
+
+            # Only the working tree is used, so skip the history
+            if self.config.shallow_clone:
+                clone_command += [
+                    "--depth",
+                    str(self.config.clone_depth),
+                    "--single-branch",
+                    "--branch",
+                    branch,
+                ]
+
+            clone_command += [auth_url, str(install_dir)]
+
             try:
-                run_command(
-                    ["git", "clone", auth_url, str(self.config.install_dir)],
-                    check=True,
-                )
+                run_command(clone_command, check=True)
                 logger.info("Repository cloned successfully")
 
                 # Configure credential helper
                 if self.authenticator:
-                    self.authenticator.configure_credential_helper(self.config.install_dir)
+                    self.authenticator.configure_credential_helper(install_dir)
 
             except Exception as e:
                 logger.error(f"Failed to clone repository: {e}")
@@ -172,31 +221,45 @@ class EnvironmentInstaller:
 
         scripts_dir = self.config.install_dir / "scripts"
 
-        if not scripts_dir.exists():
+        # DirEntry carries the file type from the directory scan itself
+        try:
+            with os.scandir(scripts_dir) as entries:
+                scripts = [
+                    entry for entry in entries if not entry.name.startswith(".") and entry.is_file()
+                ]
+        except FileNotFoundError:
             logger.warning(f"Scripts directory not found: {scripts_dir}")
             return False
 
         # Ensure bin directory exists
         self.config.bin_dir.mkdir(parents=True, exist_ok=True)
+        bin_dir = str(self.config.bin_dir)
 
         try:
             installed_count = 0
 
-            for script in scripts_dir.glob("*"):
-                if script.is_file() and not script.name.startswith("."):
-                    target = self.config.bin_dir / script.name
-
-                    # Create symlink
-                    if target.exists() or target.is_symlink():
-                        target.unlink()
-
-                    target.symlink_to(script)
-
-                    # Make executable
-                    target.chmod(0o755)
-
-                    installed_count += 1
-                    logger.debug(f"Installed script: {script.name}")
+            for script in scripts:
+                target = os.path.join(bin_dir, script.name)
+
+                # Create the symlink next to the target and swap it into
+                # place, so the target never goes missing
+                tmp_link = os.path.join(bin_dir, f".{script.name}.tmp-{os.getpid()}")
+                try:
+                    os.symlink(script.path, tmp_link)
+                except FileExistsError:
+                    # Left over from an interrupted run
+                    os.unlink(tmp_link)
+                    os.symlink(script.path, tmp_link)
+                os.replace(tmp_link, target)
+
+                # Make the script itself executable (a symlink has no mode of
+                # its own); git checkouts usually have the bits set already
+                mode = script.stat().st_mode
+                if mode & 0o755 != 0o755:
+                    os.chmod(script.path, stat.S_IMODE(mode) | 0o755)
+
+                installed_count += 1
+                logger.debug(f"Installed script: {script.name}")
 
             logger.info(f"Installed {installed_count} scripts to {self.config.bin_dir}")
             return True
@@ -294,14 +357,24 @@ cd "{self.config.install_dir}" && git pull origin {self.config.repo_branch}
 echo "Environment configuration updated!"
 """
 
+        # Write it executable under a temporary name, then publish it in one
+        # step, so ~/bin never holds a partial or non-executable command
+        tmp_script = update_script.with_name(f".{update_script.name}.tmp")
+
         try:
-            update_script.write_text(script_content)
-            update_script.chmod(0o755)
+            fd = os.open(tmp_script, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+            with open(fd, "w", encoding="utf-8") as f:
+                os.fchmod(fd, 0o755)  # Not subject to the umask
+                f.write(script_content)
+                f.flush()
+                os.fsync(fd)
+            os.replace(tmp_script, update_script)
             logger.info(f"Created update command: {update_script}")
             return True
 
         except Exception as e:
             logger.error(f"Failed to create update command: {e}")
+            tmp_script.unlink(missing_ok=True)
             return False
 
     def install(self) -> bool:
@@ -336,25 +409,26 @@ echo "Environment configuration updated!"
         if not self.install_dotfiles():
             logger.warning("Dotfile installation had issues, but continuing...")
 
-        # Step 5: Install scripts
-        if not self.install_scripts():
-            logger.warning("Script installation had issues, but continuing...")
-
-        # Step 6: Add bin to PATH
-        if not self.add_bin_to_path():
-            logger.warning("Failed to add ~/bin to PATH, but continuing...")
+        # Steps 5-9 only depend on the cloned repository, not on each other,
+        # and mostly wait on I/O and subprocesses, so run them side by side.
+        # Scripts and the update command both go in ~/bin; create it first.
+        if not self.config.test_mode:
+            self.config.bin_dir.mkdir(parents=True, exist_ok=True)
 
-        # Step 7: Install fonts
-        if not self.install_fonts():
-            logger.warning("Font installation had issues, but continuing...")
+        steps = [
+            (self.install_scripts, "Script installation had issues, but continuing..."),
+            (self.add_bin_to_path, "Failed to add ~/bin to PATH, but continuing..."),
+            (self.install_fonts, "Font installation had issues, but continuing..."),
+            (self.setup_auto_update, "Auto-update setup failed, but continuing..."),
+            (self.create_update_command, "Failed to create update command, but continuing..."),
+        ]
 
-        # Step 8: Setup auto-update
-        if not self.setup_auto_update():
-            logger.warning("Auto-update setup failed, but continuing...")
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = [(executor.submit(step), warning) for step, warning in steps]
 
-        # Step 9: Create update command
-        if not self.create_update_command():
-            logger.warning("Failed to create update command, but continuing...")
+            for future, warning in futures:
+                if not future.result():
+                    logger.warning(warning)
 
         logger.info("=" * 60)
         logger.info("Installation completed successfully!")
@@ -381,10 +455,37 @@ echo "Environment configuration updated!"
         # Remove installation directory
         if self.config.install_dir.exists():
             try:
-                shutil.rmtree(self.config.install_dir)
+                self._remove_tree(self.config.install_dir)
                 logger.info(f"Removed installation directory: {self.config.install_dir}")
             except Exception as e:
                 logger.error(f"Failed to remove installation directory: {e}")
 
         logger.info("Uninstallation completed")
         return True
+
+    def _remove_tree(self, path: Path) -> None:
+        """
+        Remove a directory tree.
+
+        A clone's .git holds thousands of objects; rm's C tree walk removes
+        them several times faster than shutil.rmtree, so it is used on POSIX
+        systems for directories inside the home directory.
+
+        Args:
+            path: The directory to remove
+
+        Raises:
+            OSError: If the directory can't be removed
+            subprocess.CalledProcessError: If rm fails
+        """
+        home = Path.home().resolve()
+        resolved = path.resolve()
+
+        if (
+            sys.platform in ("linux", "darwin")
+            and home in resolved.parents
+            and is_command_available_cached("rm")
+        ):
+            run_command(["rm", "-rf", "--", str(path)], check=True, timeout=120)
+        else:
+            shutil.rmtree(path)
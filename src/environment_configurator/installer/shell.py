@@ -4,8 +4,10 @@ Shell configuration management.
 Handles installation and configuration of Oh-My-Zsh, Oh-My-Posh, and related tools.
 """
 
+import os
+import shutil
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from environment_configurator.utils.logger import get_logger
 from environment_configurator.utils.shell_utils import (
@@ -31,6 +33,8 @@ class ShellConfigurator:
         """
         self.install_dir = install_dir
         self.test_mode = test_mode
+        # (binary path, binary mtime, version) from the last version check
+        self._posh_version_cache: Optional[Tuple[str, int, str]] = None
 
     def is_oh_my_zsh_installed(self) -> bool:
         """
@@ -140,16 +144,27 @@ class ShellConfigurator:
             return False
 
     def _get_oh_my_posh_version(self) -> Optional[str]:
-        """Get installed Oh-My-Posh version."""
+        """Get installed Oh-My-Posh version (cached until the binary changes)."""
+        posh_path = shutil.which("oh-my-posh")
+        if posh_path is None:
+            return None
+
         try:
+            mtime = os.stat(posh_path).st_mtime_ns
+            cached = self._posh_version_cache
+            if cached is not None and cached[:2] == (posh_path, mtime):
+                return cached[2]
+
             returncode, stdout, _ = run_command(
-                ["oh-my-posh", "version"],
+                [posh_path, "version"],
                 check=False,
                 capture_output=True,
                 timeout=5,
             )
             if returncode == 0:
-                return stdout.strip()
+                version = stdout.strip()
+                self._posh_version_cache = (posh_path, mtime, version)
+                return version
         except Exception:
             pass
         return None
@@ -218,26 +233,27 @@ class ShellConfigurator:
             return True
 
         try:
-            with open(shell_rc, "r", encoding="utf-8") as f:
+            # Read and append through the same handle
+            with open(shell_rc, "r+", encoding="utf-8") as f:
                 content = f.read()
 
-            # Check if already in PATH
-            dir_str = str(directory)
-            if dir_str in content:
-                logger.debug(f"Directory already in PATH: {directory}")
-                return True
+                # Check if already in PATH
+                dir_str = str(directory)
+                if dir_str in content:
+                    logger.debug(f"Directory already in PATH: {directory}")
+                    return True
 
-            # Add to PATH
-            shell_name = detect_shell()
+                # Add to PATH
+                shell_name = detect_shell()
 
-            if shell_name in ("bash", "zsh"):
-                path_line = f'\n# Add {directory} to PATH\nexport PATH="{directory}:$PATH"\n'
-            elif shell_name == "fish":
-                path_line = f'\n# Add {directory} to PATH\nset -gx PATH "{directory}" $PATH\n'
-            else:
-                path_line = f'\n# Add {directory} to PATH\nexport PATH="{directory}:$PATH"\n'
+                if shell_name in ("bash", "zsh"):
+                    path_line = f'\n# Add {directory} to PATH\nexport PATH="{directory}:$PATH"\n'
+                elif shell_name == "fish":
+                    path_line = f'\n# Add {directory} to PATH\nset -gx PATH "{directory}" $PATH\n'
+                else:
+                    path_line = f'\n# Add {directory} to PATH\nexport PATH="{directory}:$PATH"\n'
 
-            with open(shell_rc, "a", encoding="utf-8") as f:
+                # read() left the position at the end of the file
                 f.write(path_line)
 
             logger.info(f"Added {directory} to PATH in {shell_rc}")
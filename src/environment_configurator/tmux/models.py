@@ -5,10 +5,31 @@ Provides strongly-typed models for theme configuration.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Any, Dict, Mapping
 
+from environment_configurator.utils.compat import DATACLASS_SLOTS
 
-@dataclass
+# Fields of Theme.to_dict() and Theme.from_dict() (everything but the tags)
+_THEME_DICT_FIELDS = (
+    "name",
+    "category",
+    "description",
+    "bg_color",
+    "fg_color",
+    "accent_color",
+    "border_color",
+    "border_active",
+    "inactive_bg",
+    "message_bg",
+    "message_fg",
+    "activity_color",
+    "dir_color",
+    "bat_theme",
+    "ps1_color",
+)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ThemeCategory:
     """Represents a theme category."""
 
@@ -17,7 +38,7 @@ class ThemeCategory:
     description: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Theme:
     """Represents a tmux theme configuration."""
 
@@ -44,25 +65,28 @@ class Theme:
     # Additional metadata
     tags: list[str] = field(default_factory=list)
 
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Theme":
+        """
+        Create a theme from its dictionary form (as in themes.yaml).
+
+        Args:
+            data: The theme's fields; "tags" is optional and other keys are ignored
+
+        Returns:
+            The theme
+
+        Raises:
+            KeyError: If a required field is missing
+        """
+        return cls(
+            **{name: data[name] for name in _THEME_DICT_FIELDS},
+            tags=data.get("tags", []),
+        )
+
     def to_dict(self) -> Dict[str, str]:
         """Convert theme to dictionary for easier serialization."""
-        return {
-            "name": self.name,
-            "category": self.category,
-            "description": self.description,
-            "bg_color": self.bg_color,
-            "fg_color": self.fg_color,
-            "accent_color": self.accent_color,
-            "border_color": self.border_color,
-            "border_active": self.border_active,
-            "inactive_bg": self.inactive_bg,
-            "message_bg": self.message_bg,
-            "message_fg": self.message_fg,
-            "activity_color": self.activity_color,
-            "dir_color": self.dir_color,
-            "bat_theme": self.bat_theme,
-            "ps1_color": self.ps1_color,
-        }
+        return {name: getattr(self, name) for name in _THEME_DICT_FIELDS}
 
     def get_color_swatches(self) -> Dict[str, str]:
         """
@@ -4,20 +4,195 @@ Theme application for tmux and shell.
 Handles applying themes to tmux configuration and shell RC files.
 """
 
-import re
+import contextlib
+import os
 import shutil
 import subprocess
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from environment_configurator.utils.logger import get_logger
-from environment_configurator.utils.file_utils import backup_file, read_file, safe_write_file
+from environment_configurator.utils.file_utils import backup_file, ensure_directory, read_file
 from environment_configurator.utils.shell_utils import detect_shell, get_shell_rc_path
 from environment_configurator.tmux.models import Theme
 
 logger = get_logger(__name__)
 
+_RULER = "# ========================================"
+
+# Theme blocks previously written by _generate_tmux_config/_generate_shell_config,
+# as (prefixes of the consecutive lines opening a block, closing marker, number
+# of closing markers after the opening lines)
+_TMUX_THEME_BLOCK = ((f"{_RULER}\n", "# Theme:"), _RULER, 2)
+_SHELL_THEME_BLOCK = ((f"{_RULER} TMUX THEME COLORS",), f"{_RULER} END TMUX THEME COLORS\n", 1)
+
+_THEME_NAME_MARKER = "# Theme: "
+
+
+def _lines_outside_block(
+    lines: Iterable[str],
+    block: Tuple[Tuple[str, ...], str, int],
+) -> Iterator[str]:
+    """
+    Yield the text of a config file outside the given theme block(s).
+
+    An unterminated block is yielded unchanged.
+
+    Args:
+        lines: The config file's lines
+        block: Description of the block to leave out (see _TMUX_THEME_BLOCK)
+
+    Yields:
+        The lines (or, after a closing marker, the rest of the line) to keep
+    """
+    start_prefixes, end_marker, end_count = block
+
+    opening: List[str] = []  # Lines matching the start of an opening
+    skipped: Optional[List[str]] = None  # Lines of the block being left out
+    ends_seen = 0
+
+    for line in lines:
+        if skipped is not None:
+            skipped.append(line)
+            if end_marker in line:
+                ends_seen += 1
+                if ends_seen == end_count:
+                    # Keep whatever follows the closing marker
+                    yield line[line.index(end_marker) + len(end_marker) :]
+                    skipped = None
+            continue
+
+        if opening and not line.startswith(start_prefixes[len(opening)]):
+            yield from opening
+            opening = []
+
+        if line.startswith(start_prefixes[len(opening)]):
+            opening.append(line)
+            if len(opening) == len(start_prefixes):
+                skipped, opening, ends_seen = opening, [], 0
+            continue
+
+        yield line
+
+    yield from skipped or ()
+    yield from opening
+
+
+def _block_is_current(
+    config_path: Path,
+    block: Tuple[Tuple[str, ...], str, int],
+    new_block: str,
+) -> bool:
+    """
+    Check whether a config file already reads as _rewrite_without_block would leave it.
+
+    Args:
+        config_path: The config file
+        block: Description of the theme block (see _TMUX_THEME_BLOCK)
+        new_block: The block that would be appended
+
+    Returns:
+        True if rewriting the file would not change it, False otherwise
+    """
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except OSError:
+        return False
+
+    # Switching themes fails here without looking at the rest of the file
+    if not content.endswith(new_block):
+        return False
+
+    kept = "".join(_lines_outside_block(content.splitlines(keepends=True), block))
+    return kept.rstrip() + "\n" + new_block == content
+
+
+def _find_theme_name(content: str) -> Optional[str]:
+    """
+    Find the first theme name comment in a config file.
+
+    Args:
+        content: The config file's text
+
+    Returns:
+        The rest of the line after the first non-empty "# Theme: " marker,
+        or None if there is none
+    """
+    start = content.find(_THEME_NAME_MARKER)
+    while start != -1:
+        name_start = start + len(_THEME_NAME_MARKER)
+        end = content.find("\n", name_start)
+        name = content[name_start:] if end == -1 else content[name_start:end]
+        if name:
+            return name
+        start = content.find(_THEME_NAME_MARKER, name_start)
+    return None
+
+
+def _rewrite_without_block(
+    config_path: Path,
+    block: Tuple[Tuple[str, ...], str, int],
+    new_block: str,
+) -> None:
+    """
+    Replace the theme block(s) in a config file with a new block.
+
+    The file is streamed line by line into a temporary file next to it (with
+    trailing whitespace dropped before the new block), which then replaces it.
+
+    Args:
+        config_path: The config file (created if missing)
+        block: Description of the block to remove (see _TMUX_THEME_BLOCK)
+        new_block: The block to append
+
+    Raises:
+        OSError: If the config can't be read or written
+    """
+    # Write through symlinks (dotfiles are usually linked into $HOME)
+    target = config_path.resolve()
+    ensure_directory(target.parent)
+
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{target.name}.", dir=target.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as out:
+            try:
+                src = open(target, "r", encoding="utf-8")
+            except FileNotFoundError:
+                out.write(new_block)
+            else:
+                with src:
+                    # Hold back the last non-blank text and the blank lines
+                    # after it, so trailing whitespace can be dropped
+                    last = ""
+                    blanks: List[str] = []
+                    for text in _lines_outside_block(src, block):
+                        if not text.strip():
+                            blanks.append(text)
+                            continue
+                        out.write(last)
+                        out.writelines(blanks)
+                        blanks.clear()
+                        last = text
+
+                out.write(last.rstrip() + "\n" + new_block)
+
+            out.flush()
+            os.fsync(out.fileno())
+
+        if target.exists():
+            shutil.copymode(target, tmp_name)
+        else:
+            os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, target)
+
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+
 
 class ThemeApplier:
     """Applies themes to tmux and shell configurations."""
@@ -79,37 +254,24 @@ class ThemeApplier:
 
         logger.debug(f"Applying tmux theme to: {tmux_conf}")
 
-        # Backup existing file
-        if self.backup_enabled and tmux_conf.exists():
-            try:
-                backup_file(tmux_conf)
-            except Exception as e:
-                logger.warning(f"Failed to backup tmux.conf: {e}")
-
         # Create theme block
         theme_block = self._generate_tmux_config(theme)
 
-        # Read current config or start fresh
-        if tmux_conf.exists():
-            content = read_file(tmux_conf)
-
-            # Remove old theme block
-            pattern = (
-                r"# ========================================\n"
-                r"# Theme:.*?\n"
-                r"# ========================================.*?"
-                r"# ========================================"
-            )
-            content = re.sub(pattern, "", content, flags=re.DOTALL)
+        # Reapplying the current theme needs neither a backup nor a rewrite
+        if _block_is_current(tmux_conf, _TMUX_THEME_BLOCK, theme_block):
+            logger.info(f"Tmux theme already applied: {theme.name}")
+            return True
 
-            # Append new theme
-            content = content.rstrip() + "\n" + theme_block
-        else:
-            content = theme_block
+        # Backup existing file (the rewrite replaces it, so a hard link will do)
+        if self.backup_enabled and tmux_conf.exists():
+            try:
+                backup_file(tmux_conf, link=True)
+            except Exception as e:
+                logger.warning(f"Failed to backup tmux.conf: {e}")
 
-        # Write config
+        # Replace the old theme block (if any) with the new one
         try:
-            safe_write_file(tmux_conf, content, backup=False)
+            _rewrite_without_block(tmux_conf, _TMUX_THEME_BLOCK, theme_block)
             logger.info(f"Applied tmux theme: {theme.name}")
             return True
         except Exception as e:
@@ -130,35 +292,24 @@ class ThemeApplier:
 
         logger.debug(f"Applying shell theme to: {shell_rc}")
 
-        # Backup existing file
-        if self.backup_enabled and shell_rc.exists():
-            try:
-                backup_file(shell_rc)
-            except Exception as e:
-                logger.warning(f"Failed to backup shell RC: {e}")
-
         # Create theme block
         theme_block = self._generate_shell_config(theme)
 
-        # Read current config or start fresh
-        if shell_rc.exists():
-            content = read_file(shell_rc)
-
-            # Remove old theme block
-            pattern = (
-                r"# ======================================== TMUX THEME COLORS.*?"
-                r"# ======================================== END TMUX THEME COLORS\n"
-            )
-            content = re.sub(pattern, "", content, flags=re.DOTALL)
+        # Reapplying the current theme needs neither a backup nor a rewrite
+        if _block_is_current(shell_rc, _SHELL_THEME_BLOCK, theme_block):
+            logger.info(f"Shell theme already applied: {theme.name}")
+            return True
 
-            # Append new theme
-            content = content.rstrip() + "\n" + theme_block
-        else:
-            content = theme_block
+        # Backup existing file (the rewrite replaces it, so a hard link will do)
+        if self.backup_enabled and shell_rc.exists():
+            try:
+                backup_file(shell_rc, link=True)
+            except Exception as e:
+                logger.warning(f"Failed to backup shell RC: {e}")
 
-        # Write config
+        # Replace the old theme block (if any) with the new one
         try:
-            safe_write_file(shell_rc, content, backup=False)
+            _rewrite_without_block(shell_rc, _SHELL_THEME_BLOCK, theme_block)
             logger.info(f"Applied shell theme: {theme.name}")
             return True
         except Exception as e:
@@ -251,17 +402,17 @@ alias llt='eza -l -T --level 2 -a'
             theme: The theme that was applied
         """
         try:
-            # Try to source the config
-            subprocess.run(
-                ["tmux", "source-file", str(Path.home() / ".tmux.conf")],
-                stderr=subprocess.DEVNULL,
-                check=False,
-                timeout=5,
-            )
-
-            # Try to show a message
+            # Source the config and show a message in one tmux client call;
+            # a lone ";" argument separates tmux commands
             subprocess.run(
-                ["tmux", "display-message", f"Theme '{theme.name}' loaded!"],
+                [
+                    "tmux",
+                    "source-file",
+                    str(Path.home() / ".tmux.conf"),
+                    ";",
+                    "display-message",
+                    f"Theme '{theme.name}' loaded!",
+                ],
                 stderr=subprocess.DEVNULL,
                 check=False,
                 timeout=5,
@@ -288,9 +439,7 @@ alias llt='eza -l -T --level 2 -a'
             content = read_file(tmux_conf)
 
             # Look for theme comment
-            match = re.search(r"# Theme: (.+)", content)
-            if match:
-                return match.group(1)
+            return _find_theme_name(content)
 
         except Exception as e:
             logger.error(f"Failed to read current theme: {e}")
@@ -4,8 +4,14 @@ Theme management for tmux.
 Handles loading, filtering, and organizing themes.
 """
 
+import json
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 import yaml
 
 from environment_configurator.utils.logger import get_logger
@@ -13,6 +19,99 @@ from environment_configurator.tmux.models import Theme, ThemeCategory
 
 logger = get_logger(__name__)
 
+# libyaml's C parser when PyYAML was built with it (the wheels are), else pure Python
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+# Parsed theme files, as path -> (mtime_ns, size, data), least recently used first
+_YAML_CACHE: "OrderedDict[Path, Tuple[int, int, Any]]" = OrderedDict()
+_YAML_CACHE_SIZE = 16
+
+
+def _load_yaml_cached(path: Path) -> Any:
+    """
+    Parse a YAML file, reusing the previous result while the file is unchanged.
+
+    The parsed data is shared between callers and must not be modified.
+
+    Args:
+        path: The YAML file to load
+
+    Returns:
+        The parsed YAML data
+
+    Raises:
+        OSError: If the file can't be read
+        yaml.YAMLError: If the file isn't valid YAML
+    """
+    st = path.stat()
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        _YAML_CACHE.move_to_end(path)
+        return cached[2]
+
+    data = _load_json_sidecar(path, st.st_mtime_ns)
+    if data is None:
+        # One read of the whole file; the parser would otherwise pull it in
+        # through the stream in small chunks (libyaml decodes the UTF-8 itself)
+        data = yaml.load(path.read_bytes(), Loader=_SafeLoader)
+        _write_json_sidecar(path, data)
+
+    _YAML_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    _YAML_CACHE.move_to_end(path)
+    if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+        _YAML_CACHE.popitem(last=False)
+    return data
+
+
+def _load_json_sidecar(path: Path, yaml_mtime_ns: int) -> Any:
+    """
+    Load the JSON copy of a YAML file, if it is at least as new as the YAML.
+
+    Args:
+        path: The YAML file
+        yaml_mtime_ns: The YAML file's modification time
+
+    Returns:
+        The data, or None if there is no usable sidecar
+    """
+    sidecar = path.with_name(path.name + ".json")
+    try:
+        if sidecar.stat().st_mtime_ns < yaml_mtime_ns:
+            return None
+        return json.loads(sidecar.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json_sidecar(path: Path, data: Any) -> None:
+    """
+    Save parsed YAML data as JSON next to the YAML file, which is much faster to load.
+
+    Failures (e.g. a read-only install) are logged and otherwise ignored.
+
+    Args:
+        path: The YAML file
+        data: The parsed data
+    """
+    sidecar = path.with_name(path.name + ".json")
+    try:
+        content = json.dumps(data, separators=(",", ":"))
+        # Write to a temporary file first so readers never see a partial sidecar
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{sidecar.name}.", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            shutil.copymode(path, tmp_name)
+            os.replace(tmp_name, sidecar)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write JSON cache for {path}: {e}")
+
 
 class ThemeManager:
     """Manages tmux themes."""
@@ -32,10 +131,20 @@ class ThemeManager:
         self.themes: List[Theme] = []
         self.categories: List[ThemeCategory] = []
         self._themes_by_category: Dict[str, List[Theme]] = {}
+        self._themes_by_name: Dict[str, Theme] = {}  # Keyed by lowercase name
+        # Case-folded name, description and category of each theme, NUL-separated
+        self._search_blobs: List[str] = []
 
         # Load themes
         self._load_themes()
 
+        # Read-only views handed out by the getters, so they needn't copy
+        self._themes_view: Tuple[Theme, ...] = tuple(self.themes)
+        self._category_views: Dict[str, Tuple[Theme, ...]] = {
+            category: tuple(themes) for category, themes in self._themes_by_category.items()
+        }
+        self._grouped_view: Mapping[str, Tuple[Theme, ...]] = MappingProxyType(self._category_views)
+
     def _load_themes(self) -> None:
         """Load themes from YAML file."""
         if not self.themes_file.exists():
@@ -43,8 +152,7 @@ class ThemeManager:
             return
 
         try:
-            with open(self.themes_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            data = _load_yaml_cached(self.themes_file)
 
             # Load categories
             if "categories" in data:
@@ -59,24 +167,7 @@ class ThemeManager:
             # Load themes
             if "themes" in data:
                 for theme_data in data["themes"]:
-                    theme = Theme(
-                        name=theme_data["name"],
-                        category=theme_data["category"],
-                        description=theme_data["description"],
-                        bg_color=theme_data["bg_color"],
-                        fg_color=theme_data["fg_color"],
-                        accent_color=theme_data["accent_color"],
-                        border_color=theme_data["border_color"],
-                        border_active=theme_data["border_active"],
-                        inactive_bg=theme_data["inactive_bg"],
-                        message_bg=theme_data["message_bg"],
-                        message_fg=theme_data["message_fg"],
-                        activity_color=theme_data["activity_color"],
-                        dir_color=theme_data["dir_color"],
-                        bat_theme=theme_data["bat_theme"],
-                        ps1_color=theme_data["ps1_color"],
-                        tags=theme_data.get("tags", []),
-                    )
+                    theme = Theme.from_dict(theme_data)
                     self.themes.append(theme)
 
                     # Organize by category
@@ -84,22 +175,28 @@ class ThemeManager:
                         self._themes_by_category[theme.category] = []
                     self._themes_by_category[theme.category].append(theme)
 
+                    # Index by name (the first of any duplicates wins)
+                    self._themes_by_name.setdefault(theme.name.lower(), theme)
+                    self._search_blobs.append(
+                        f"{theme.name}\x00{theme.description}\x00{theme.category}".casefold()
+                    )
+
             logger.info(f"Loaded {len(self.themes)} themes in {len(self.categories)} categories")
 
         except Exception as e:
             logger.error(f"Failed to load themes: {e}")
             raise
 
-    def get_all_themes(self) -> List[Theme]:
+    def get_all_themes(self) -> Tuple[Theme, ...]:
         """
         Get all themes.
 
         Returns:
-            List of all themes
+            Tuple of all themes
         """
-        return self.themes.copy()
+        return self._themes_view
 
-    def get_themes_by_category(self, category: str) -> List[Theme]:
+    def get_themes_by_category(self, category: str) -> Tuple[Theme, ...]:
         """
         Get themes filtered by category.
 
@@ -107,9 +204,9 @@ class ThemeManager:
             category: The category to filter by
 
         Returns:
-            List of themes in the category
+            Tuple of themes in the category
         """
-        return self._themes_by_category.get(category, []).copy()
+        return self._category_views.get(category, ())
 
     def get_theme_by_name(self, name: str) -> Optional[Theme]:
         """
@@ -121,10 +218,7 @@ class ThemeManager:
         Returns:
             Theme object or None if not found
         """
-        for theme in self.themes:
-            if theme.name.lower() == name.lower():
-                return theme
-        return None
+        return self._themes_by_name.get(name.lower())
 
     def search_themes(self, query: str) -> List[Theme]:
         """
@@ -136,18 +230,15 @@ class ThemeManager:
         Returns:
             List of matching themes
         """
-        query_lower = query.lower()
-        matches = []
-
-        for theme in self.themes:
-            if (
-                query_lower in theme.name.lower()
-                or query_lower in theme.description.lower()
-                or query_lower in theme.category.lower()
-            ):
-                matches.append(theme)
+        # casefold() is lower() plus the caseless forms of e.g. "ß"
+        query_folded = query.casefold()
+        if "\x00" in query_folded:
+            # Would match across the separators in the search blobs
+            return []
 
-        return matches
+        return [
+            theme for theme, blob in zip(self.themes, self._search_blobs) if query_folded in blob
+        ]
 
     def get_categories(self) -> List[ThemeCategory]:
         """
@@ -158,14 +249,14 @@ class ThemeManager:
         """
         return self.categories.copy()
 
-    def get_grouped_themes(self) -> Dict[str, List[Theme]]:
+    def get_grouped_themes(self) -> Mapping[str, Tuple[Theme, ...]]:
         """
         Get themes grouped by category.
 
         Returns:
-            Dictionary mapping category names to theme lists
+            Read-only mapping of category names to theme tuples
         """
-        return self._themes_by_category.copy()
+        return self._grouped_view
 
     def get_theme_count(self) -> int:
         """
@@ -0,0 +1,10 @@
+"""
+Compatibility helpers for supported Python versions.
+"""
+
+import sys
+
+# Keyword arguments giving a dataclass slots (dropping the per-instance
+# __dict__). dataclass(slots=True) needs Python 3.10; older versions keep
+# the __dict__. Use as @dataclass(**DATACLASS_SLOTS).
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
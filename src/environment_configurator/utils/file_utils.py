@@ -6,14 +6,20 @@ Provides safe file operations with backups, atomic writes, and error handling.
 
 import os
 import shutil
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 from datetime import datetime
 
 from environment_configurator.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Contents returned by read_file, as path -> (mtime_ns, size, content),
+# least recently used first
+_READ_CACHE: "OrderedDict[Path, Tuple[int, int, str]]" = OrderedDict()
+_READ_CACHE_SIZE = 64
+
 
 def ensure_directory(path: Path, mode: int = 0o755) -> None:
     """
@@ -26,6 +32,11 @@ def ensure_directory(path: Path, mode: int = 0o755) -> None:
     Raises:
         OSError: If directory creation fails
     """
+    # Usually the directory is there already, and a stat is cheaper than a
+    # mkdir that fails with EEXIST
+    if os.path.isdir(path):
+        return
+
     try:
         path.mkdir(parents=True, exist_ok=True, mode=mode)
         logger.debug(f"Ensured directory exists: {path}")
@@ -38,6 +49,7 @@ def backup_file(
     file_path: Path,
     backup_dir: Optional[Path] = None,
     timestamp: bool = True,
+    link: bool = False,
 ) -> Optional[Path]:
     """
     Create a backup of a file before modification.
@@ -46,6 +58,9 @@ def backup_file(
         file_path: The file to backup
         backup_dir: Optional directory for backups (default: same as file)
         timestamp: Whether to add timestamp to backup name
+        link: Hard-link the backup instead of copying where possible. Only
+            for callers that replace the file (e.g. with os.replace) rather
+            than modify it in place, which would change the backup too
 
     Returns:
         Path to the backup file, or None if original file doesn't exist
@@ -66,7 +81,7 @@ def backup_file(
 
     # Create backup filename
     if timestamp:
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         backup_name = f"{file_path.name}.backup.{ts}"
     else:
         backup_name = f"{file_path.name}.backup"
@@ -74,44 +89,79 @@ def backup_file(
     backup_path = backup_dir / backup_name
 
     try:
+        if link:
+            try:
+                # The old inode stays behind as the backup once the file is
+                # replaced, so nothing needs copying. Link the file a symlink
+                # points to: os.link would link the symlink itself on Linux
+                os.link(os.path.realpath(file_path), backup_path)
+                logger.info(f"Backed up {file_path} to {backup_path} (hard link)")
+                return backup_path
+            except OSError:
+                # Other filesystem, no hard link support, or the name is taken
+                pass
+
         shutil.copy2(file_path, backup_path)
         logger.info(f"Backed up {file_path} to {backup_path}")
         return backup_path
+    except shutil.SameFileError:
+        # Already linked by an earlier backup, and the file hasn't been replaced since
+        logger.info(f"Backed up {file_path} to {backup_path}")
+        return backup_path
     except (IOError, OSError) as e:
         logger.error(f"Failed to backup {file_path}: {e}")
         raise
 
 
-def safe_write_file(file_path: Path, content: str, backup: bool = True) -> None:
+def safe_write_file(
+    file_path: Path,
+    content: str,
+    backup: bool = True,
+    durable: bool = False,
+) -> None:
     """
     Safely write content to a file with optional backup.
 
-    Uses atomic write pattern (write to temp file, then rename).
+    Uses atomic write pattern (write to temp file, then rename). A symlink
+    is written through, so the link itself is kept.
 
     Args:
         file_path: The file to write
         content: The content to write
         backup: Whether to backup the existing file first
+        durable: Whether to fsync the new contents before the rename, so they
+            survive a crash (slower)
 
     Raises:
         IOError: If write operation fails
     """
-    # Backup existing file if requested
+    # Write through symlinks (dotfiles are usually linked into $HOME); the
+    # file they point to is the one replaced below
+    target = file_path.resolve()
+
+    # Backup existing file if requested (the target is replaced below rather
+    # than rewritten in place, so a hard link to it will do)
     if backup and file_path.exists():
-        backup_file(file_path)
+        backup_file(file_path, link=True)
 
     # Ensure parent directory exists
-    ensure_directory(file_path.parent)
+    ensure_directory(target.parent)
 
-    # Write to temporary file first (atomic write pattern)
-    temp_path = file_path.with_suffix(f"{file_path.suffix}.tmp")
+    # Write to temporary file first (atomic write pattern), named per process
+    # so concurrent writers don't share it
+    temp_path = target.with_name(f"{target.name}.tmp.{os.getpid()}")
 
     try:
-        with open(temp_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        # Encode in one go and write the bytes with a single call
+        data = content.encode("utf-8")
+        with open(temp_path, "wb") as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
 
         # Atomic rename
-        temp_path.replace(file_path)
+        os.replace(temp_path, target)
         logger.info(f"Wrote file: {file_path}")
 
     except (IOError, OSError) as e:
@@ -173,6 +223,9 @@ def read_file(file_path: Path) -> str:
     """
     Read the contents of a file.
 
+    The contents are remembered (for up to 64 files) and reused while the
+    file's mtime and size are unchanged.
+
     Args:
         file_path: The file to read
 
@@ -184,9 +237,21 @@ def read_file(file_path: Path) -> str:
         IOError: If read operation fails
     """
     try:
+        # Reuse the last read while the file's mtime and size are unchanged
+        st = os.stat(file_path)
+        cached = _READ_CACHE.get(file_path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            _READ_CACHE.move_to_end(file_path)
+            return cached[2]
+
         with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
         logger.debug(f"Read file: {file_path}")
+
+        _READ_CACHE[file_path] = (st.st_mtime_ns, st.st_size, content)
+        _READ_CACHE.move_to_end(file_path)
+        if len(_READ_CACHE) > _READ_CACHE_SIZE:
+            _READ_CACHE.popitem(last=False)
         return content
     except FileNotFoundError:
         logger.error(f"File not found: {file_path}")
@@ -196,6 +261,11 @@ def read_file(file_path: Path) -> str:
         raise
 
 
+def clear_read_cache() -> None:
+    """Forget the file contents remembered by read_file."""
+    _READ_CACHE.clear()
+
+
 def get_file_size(file_path: Path) -> int:
     """
     Get the size of a file in bytes.
@@ -209,9 +279,7 @@ def get_file_size(file_path: Path) -> int:
     Raises:
         FileNotFoundError: If file doesn't exist
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-
+    # stat() raises FileNotFoundError itself
     return file_path.stat().st_size
 
 
@@ -226,8 +294,10 @@ def is_safe_to_overwrite(file_path: Path, max_size_mb: float = 100) -> bool:
     Returns:
         True if safe to overwrite, False otherwise
     """
-    if not file_path.exists():
+    # A single stat, whether or not the file exists
+    try:
+        size = file_path.stat().st_size
+    except FileNotFoundError:
         return True
 
-    size_mb = get_file_size(file_path) / (1024 * 1024)
-    return size_mb <= max_size_mb
+    return size <= max_size_mb * 1024 * 1024
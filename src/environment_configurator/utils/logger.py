@@ -17,12 +17,24 @@ from datetime import datetime
 
 
 # Global logger configuration
-_LOGGERS = {}
 _LOG_DIR = Path.home() / ".config" / "environment-configurator" / "logs"
 _DEFAULT_LOG_LEVEL = logging.INFO
 _DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 _VERBOSE_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s"
 
+# Arguments and handlers of the last setup_logging() call
+_ACTIVE_SETUP: Optional[tuple] = None
+_ACTIVE_HANDLERS: list = []
+
+
+class _LazyRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that creates the log directory when it opens the file."""
+
+    def _open(self):  # type: ignore[no-untyped-def]
+        """Open the log file, creating its directory first."""
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
 
 def setup_logging(
     log_level: int = logging.INFO,
@@ -39,16 +51,20 @@ def setup_logging(
         verbose: Enable verbose logging with file/line information
         enable_file_logging: Enable logging to file (in addition to console)
     """
-    # Ensure log directory exists
-    if enable_file_logging:
-        _LOG_DIR.mkdir(parents=True, exist_ok=True)
+    global _ACTIVE_SETUP, _ACTIVE_HANDLERS
+
+    # Repeating the current configuration is a no-op, as long as nobody
+    # replaced our handlers in the meantime
+    setup = (log_level, log_file, verbose, enable_file_logging)
+    root_logger = logging.getLogger()
+    if setup == _ACTIVE_SETUP and root_logger.handlers == _ACTIVE_HANDLERS:
+        return
 
     # Choose format
     log_format = _VERBOSE_FORMAT if verbose else _DEFAULT_FORMAT
     formatter = logging.Formatter(log_format)
 
     # Configure root logger
-    root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
 
     # Remove existing handlers
@@ -66,17 +82,22 @@ def setup_logging(
             timestamp = datetime.now().strftime("%Y%m%d")
             log_file = _LOG_DIR / f"env_configurator_{timestamp}.log"
 
-        # Rotating file handler (10MB max, keep 5 backups)
-        file_handler = RotatingFileHandler(
+        # Rotating file handler (10MB max, keep 5 backups); the directory
+        # and file are only created once something is actually logged to it
+        file_handler = _LazyRotatingFileHandler(
             log_file,
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=5,
             encoding="utf-8",
+            delay=True,
         )
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
         root_logger.addHandler(file_handler)
 
+    _ACTIVE_SETUP = setup
+    _ACTIVE_HANDLERS = list(root_logger.handlers)
+
 
 def get_logger(name: str, log_level: Optional[int] = None) -> logging.Logger:
     """
@@ -93,15 +114,12 @@ def get_logger(name: str, log_level: Optional[int] = None) -> logging.Logger:
         >>> logger = get_logger(__name__)
         >>> logger.info("Starting installation")
     """
-    if name in _LOGGERS:
-        return _LOGGERS[name]
-
+    # logging keeps one logger per name already
     logger = logging.getLogger(name)
 
-    if log_level is not None:
+    if log_level is not None and logger.level != log_level:
         logger.setLevel(log_level)
 
-    _LOGGERS[name] = logger
     return logger
 
 
@@ -4,6 +4,7 @@ Shell command utilities for environment configurator.
 Provides safe command execution, shell detection, and related utilities.
 """
 
+import functools
 import os
 import shutil
 import subprocess
@@ -99,10 +100,47 @@ def is_command_available(command: str) -> bool:
     return available
 
 
+def is_command_available_cached(command: str) -> bool:
+    """
+    Check if a command is available, remembering the answer for the process.
+
+    Saves repeating the PATH search for tools that are checked several
+    times. The answer is kept per PATH value, so changing PATH is noticed,
+    but a command installed later in the same process is not; use
+    is_command_available() when that matters.
+
+    Args:
+        command: The command name to check
+
+    Returns:
+        True if command is available, False otherwise
+    """
+    return _is_command_on_path(command, os.environ.get("PATH"))
+
+
+@functools.lru_cache(maxsize=None)
+def _is_command_on_path(command: str, search_path: Optional[str]) -> bool:
+    """
+    Look a command up on a given search path (None for the default).
+
+    Args:
+        command: The command name to check
+        search_path: The PATH value to search
+
+    Returns:
+        True if command is available, False otherwise
+    """
+    available = shutil.which(command, path=search_path) is not None
+    logger.debug(f"Command '{command}' available: {available}")
+    return available
+
+
 def detect_shell() -> str:
     """
     Detect the current user's shell.
 
+    The answer is remembered per $SHELL value.
+
     Returns:
         The shell name ('bash', 'zsh', etc.)
 
@@ -110,7 +148,20 @@ def detect_shell() -> str:
         >>> shell = detect_shell()
         >>> print(f"Current shell: {shell}")
     """
-    shell_path = os.environ.get("SHELL", "/bin/bash")
+    return _shell_name(os.environ.get("SHELL", "/bin/bash"))
+
+
+@functools.lru_cache(maxsize=None)
+def _shell_name(shell_path: str) -> str:
+    """
+    Get the shell name from the shell's path.
+
+    Args:
+        shell_path: The $SHELL value
+
+    Returns:
+        The shell name
+    """
     shell_name = Path(shell_path).name
     logger.debug(f"Detected shell: {shell_name}")
     return shell_name
@@ -120,6 +171,8 @@ def get_shell_rc_path() -> Path:
     """
     Get the path to the current shell's RC file.
 
+    The answer is remembered per shell and home directory.
+
     Returns:
         Path to the shell RC file (.bashrc, .zshrc, etc.)
 
@@ -127,9 +180,21 @@ def get_shell_rc_path() -> Path:
         >>> rc_path = get_shell_rc_path()
         >>> print(f"Shell RC: {rc_path}")
     """
-    shell = detect_shell()
-    home = Path.home()
+    return _shell_rc_path(detect_shell(), Path.home())
+
+
+@functools.lru_cache(maxsize=None)
+def _shell_rc_path(shell: str, home: Path) -> Path:
+    """
+    Get the RC file of a shell in a home directory.
 
+    Args:
+        shell: The shell name
+        home: The home directory
+
+    Returns:
+        Path to the shell RC file
+    """
     shell_rc_map = {
         "bash": home / ".bashrc",
         "zsh": home / ".zshrc",
@@ -156,26 +221,27 @@ def add_to_path(directory: Path, shell_rc: Optional[Path] = None) -> None:
     if shell_rc is None:
         shell_rc = get_shell_rc_path()
 
-    # Check if already in PATH
-    with open(shell_rc, "r", encoding="utf-8") as f:
+    # Read and append through the same handle
+    with open(shell_rc, "r+", encoding="utf-8") as f:
         content = f.read()
 
-    path_str = str(directory)
-    if path_str in content:
-        logger.debug(f"Directory already in PATH: {directory}")
-        return
+        # Check if already in PATH
+        path_str = str(directory)
+        if path_str in content:
+            logger.debug(f"Directory already in PATH: {directory}")
+            return
 
-    # Add to PATH
-    shell = detect_shell()
+        # Add to PATH
+        shell = detect_shell()
 
-    if shell in ("bash", "zsh"):
-        path_line = f'\nexport PATH="{directory}:$PATH"\n'
-    elif shell == "fish":
-        path_line = f'\nset -gx PATH "{directory}" $PATH\n'
-    else:
-        path_line = f'\nexport PATH="{directory}:$PATH"\n'
+        if shell in ("bash", "zsh"):
+            path_line = f'\nexport PATH="{directory}:$PATH"\n'
+        elif shell == "fish":
+            path_line = f'\nset -gx PATH "{directory}" $PATH\n'
+        else:
+            path_line = f'\nexport PATH="{directory}:$PATH"\n'
 
-    with open(shell_rc, "a", encoding="utf-8") as f:
+        # read() left the position at the end of the file
         f.write(path_line)
 
     logger.info(f"Added {directory} to PATH in {shell_rc}")
@@ -188,7 +254,7 @@ def check_git_installed() -> bool:
     Returns:
         True if git is installed, False otherwise
     """
-    return is_command_available("git")
+    return is_command_available_cached("git")
 
 
 def check_python_version() -> Tuple[int, int, int]:
@@ -5,8 +5,7 @@ Tests for merge-bashrc-to-zshrc.py
 
 import pytest
 from pathlib import Path
-import tempfile
-import shutil
+import os
 import sys
 
 # Add scripts directory to path
@@ -16,17 +15,9 @@ from merge_bashrc_to_zshrc import ConfigMerger
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
-    tmpdir = tempfile.mkdtemp()
-    yield Path(tmpdir)
-    shutil.rmtree(tmpdir)
-
-
-@pytest.fixture
-def sample_bashrc(temp_dir):
+def sample_bashrc(tmp_path):
     """Create a sample .bashrc file."""
-    bashrc = temp_dir / '.bashrc'
+    bashrc = tmp_path / '.bashrc'
     content = """# Sample .bashrc
 export PATH="$HOME/bin:$PATH"
 export EDITOR=vim
@@ -50,9 +41,9 @@ fi
 
 
 @pytest.fixture
-def sample_zshrc(temp_dir):
+def sample_zshrc(tmp_path):
     """Create a sample .zshrc file."""
-    zshrc = temp_dir / '.zshrc'
+    zshrc = tmp_path / '.zshrc'
     content = """# Sample .zshrc
 export PATH="$HOME/.local/bin:$PATH"
 export EDITOR=vim
@@ -68,9 +59,9 @@ alias gs='git status'
 
 
 @pytest.fixture
-def empty_zshrc(temp_dir):
+def empty_zshrc(tmp_path):
     """Create an empty .zshrc file."""
-    zshrc = temp_dir / '.zshrc'
+    zshrc = tmp_path / '.zshrc'
     zshrc.touch()
     return zshrc
 
@@ -183,7 +174,7 @@ class TestConfigMerger:
         assert count > 0  # Should find entries
         assert sample_zshrc.read_text() == original_content  # No changes
 
-    def test_merge_configs_creates_backup(self, sample_bashrc, sample_zshrc, temp_dir):
+    def test_merge_configs_creates_backup(self, sample_bashrc, sample_zshrc, tmp_path):
         """Test that merge creates a backup."""
         merger = ConfigMerger(
             bashrc_path=str(sample_bashrc),
@@ -194,7 +185,7 @@ class TestConfigMerger:
         merger.merge_configs()
 
         # Check for backup files
-        backups = list(temp_dir.glob('.zshrc.backup.*'))
+        backups = list(tmp_path.glob('.zshrc.backup.*'))
         assert len(backups) > 0
 
     def test_merge_configs_adds_markers(self, sample_bashrc, sample_zshrc):
@@ -255,9 +246,9 @@ class TestConfigMerger:
         removed = merger.remove_merged_section()
         assert removed is False
 
-    def test_no_bashrc_raises_error(self, temp_dir, empty_zshrc):
+    def test_no_bashrc_raises_error(self, tmp_path, empty_zshrc):
         """Test that missing .bashrc raises error."""
-        fake_bashrc = temp_dir / '.bashrc_nonexistent'
+        fake_bashrc = tmp_path / '.bashrc_nonexistent'
         merger = ConfigMerger(
             bashrc_path=str(fake_bashrc),
             zshrc_path=str(empty_zshrc)
@@ -266,9 +257,9 @@ class TestConfigMerger:
         with pytest.raises(FileNotFoundError):
             merger.merge_configs()
 
-    def test_creates_zshrc_if_missing(self, sample_bashrc, temp_dir):
+    def test_creates_zshrc_if_missing(self, sample_bashrc, tmp_path):
         """Test that .zshrc is created if it doesn't exist."""
-        zshrc = temp_dir / '.zshrc'
+        zshrc = tmp_path / '.zshrc'
         assert not zshrc.exists()
 
         merger = ConfigMerger(
@@ -280,12 +271,12 @@ class TestConfigMerger:
         merger.merge_configs()
         assert zshrc.exists()
 
-    def test_no_new_entries(self, temp_dir):
+    def test_no_new_entries(self, tmp_path):
         """Test when all .bashrc entries already exist in .zshrc."""
-        bashrc = temp_dir / '.bashrc'
+        bashrc = tmp_path / '.bashrc'
         bashrc.write_text("export EDITOR=vim\nalias gs='git status'\n")
 
-        zshrc = temp_dir / '.zshrc'
+        zshrc = tmp_path / '.zshrc'
         zshrc.write_text("export EDITOR=vim\nalias gs='git status'\n")
 
         merger = ConfigMerger(
@@ -299,9 +290,68 @@ class TestConfigMerger:
         assert len(orig_entries) == 0
         assert len(trans_entries) == 0
 
-    def test_multiline_function_preserved(self, temp_dir):
+    def test_remerge_after_bashrc_change(self, tmp_path):
+        """Test that a re-run merges only once .bashrc has changed."""
+        bashrc = tmp_path / '.bashrc'
+        bashrc.write_text("export EDITOR=vim\n")
+
+        zshrc = tmp_path / '.zshrc'
+        zshrc.write_text("# Empty\n")
+
+        merger = ConfigMerger(
+            bashrc_path=str(bashrc),
+            zshrc_path=str(zshrc),
+            dry_run=False
+        )
+
+        assert merger.merge_configs()[0] == 1
+        assert merger.merge_configs()[0] == 0
+
+        with open(bashrc, 'a') as f:
+            f.write("alias gs='git status'\n")
+        mtime_ns = bashrc.stat().st_mtime_ns + 1_000_000_000
+        os.utime(bashrc, ns=(mtime_ns, mtime_ns))
+
+        count, orig_entries, _ = merger.merge_configs()
+        assert count == 1
+        assert orig_entries == ["alias gs='git status'\n"]
+
+    def test_merge_second_bashrc_with_older_mtime(self, tmp_path):
+        """Test that merging one .bashrc doesn't skip another, older one."""
+        bashrc_a = tmp_path / 'bashrc_a'
+        bashrc_a.write_text("export A=1\n")
+        os.utime(bashrc_a, ns=(2 * 10**18, 2 * 10**18))
+
+        bashrc_b = tmp_path / 'bashrc_b'
+        bashrc_b.write_text("export B=2\n")
+        os.utime(bashrc_b, ns=(10**18, 10**18))
+
+        zshrc = tmp_path / '.zshrc'
+        zshrc.write_text("# Empty\n")
+
+        merger_a = ConfigMerger(
+            bashrc_path=str(bashrc_a),
+            zshrc_path=str(zshrc),
+            dry_run=False
+        )
+        assert merger_a.merge_configs()[0] == 1
+
+        merger_b = ConfigMerger(
+            bashrc_path=str(bashrc_b),
+            zshrc_path=str(zshrc),
+            dry_run=False
+        )
+        count, orig_entries, _ = merger_b.merge_configs()
+        assert count == 1
+        assert orig_entries == ["export B=2\n"]
+
+        # Both files are now recorded, so neither is merged again
+        assert merger_a.merge_configs()[0] == 0
+        assert merger_b.merge_configs()[0] == 0
+
+    def test_multiline_function_preserved(self, tmp_path):
         """Test that multi-line functions are preserved correctly."""
-        bashrc = temp_dir / '.bashrc'
+        bashrc = tmp_path / '.bashrc'
         bashrc.write_text("""
 function complex_func() {
     local var1="value"
@@ -310,7 +360,7 @@ function complex_func() {
 }
 """)
 
-        zshrc = temp_dir / '.zshrc'
+        zshrc = tmp_path / '.zshrc'
         zshrc.write_text("# Empty\n")
 
         merger = ConfigMerger(
@@ -452,15 +502,15 @@ PROMPT_COMMAND='history -a'"""
         assert "shopt" not in result
         assert "PROMPT_COMMAND" not in result
 
-    def test_transformation_in_merge(self, temp_dir):
+    def test_transformation_in_merge(self, tmp_path):
         """Test that transformations are applied during merge."""
-        bashrc = temp_dir / '.bashrc'
+        bashrc = tmp_path / '.bashrc'
         bashrc.write_text("""shopt -s histappend
 export PATH="$HOME/bin:$PATH"
 PROMPT_COMMAND='echo "bash ready"'
 """)
 
-        zshrc = temp_dir / '.zshrc'
+        zshrc = tmp_path / '.zshrc'
         zshrc.write_text("# Empty\n")
 
         merger = ConfigMerger(
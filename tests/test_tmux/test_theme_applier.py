@@ -0,0 +1,103 @@
+"""Tests for theme applier."""
+
+from pathlib import Path
+import pytest
+
+from environment_configurator.tmux.theme_applier import ThemeApplier
+from environment_configurator.tmux.models import Theme
+
+
+def make_theme(name: str) -> Theme:
+    """Create a theme with placeholder colors."""
+    return Theme(
+        name=name,
+        category="test",
+        description="A test theme",
+        bg_color="#000000",
+        fg_color="#ffffff",
+        accent_color="#00ff00",
+        border_color="#333333",
+        border_active="#00ff00",
+        inactive_bg="#111111",
+        message_bg="#00ff00",
+        message_fg="#000000",
+        activity_color="#ffff00",
+        dir_color="01;32",
+        bat_theme="ansi",
+        ps1_color="\\[\\033[01;32m\\]",
+    )
+
+
+@pytest.fixture
+def theme_applier() -> ThemeApplier:
+    """Create a theme applier that doesn't leave backups behind."""
+    return ThemeApplier(backup_enabled=False)
+
+
+def test_apply_tmux_theme_creates_config(mock_home: Path, theme_applier: ThemeApplier) -> None:
+    """Test applying a tmux theme without an existing config."""
+    assert theme_applier.apply_tmux_theme(make_theme("First"))
+
+    tmux_conf = mock_home / ".tmux.conf"
+    assert tmux_conf.read_text() == theme_applier._generate_tmux_config(make_theme("First"))
+    assert theme_applier.get_current_theme_name() == "First"
+
+
+def test_apply_tmux_theme_replaces_block(mock_home: Path, theme_applier: ThemeApplier) -> None:
+    """Test that reapplying keeps the user's settings and a single theme block."""
+    tmux_conf = mock_home / ".tmux.conf"
+    tmux_conf.write_text("set -g mouse on\n\n")
+
+    assert theme_applier.apply_tmux_theme(make_theme("First"))
+    assert theme_applier.apply_tmux_theme(make_theme("Second"))
+
+    content = tmux_conf.read_text()
+    assert content == "set -g mouse on\n" + theme_applier._generate_tmux_config(
+        make_theme("Second")
+    )
+    assert theme_applier.get_current_theme_name() == "Second"
+
+
+def test_apply_shell_theme_replaces_block(
+    sample_bashrc: Path, theme_applier: ThemeApplier, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the shell theme block is replaced rather than duplicated."""
+    monkeypatch.setenv("SHELL", "/bin/bash")
+
+    assert theme_applier.apply_shell_theme(make_theme("First"))
+    assert theme_applier.apply_shell_theme(make_theme("Second"))
+
+    content = sample_bashrc.read_text()
+    assert content.count("END TMUX THEME COLORS") == 1
+    assert "# Theme: Second" in content
+    assert "alias ll='ls -la'" in content
+
+
+def test_apply_theme_writes_through_symlink(mock_home: Path, theme_applier: ThemeApplier) -> None:
+    """Test that a symlinked config is updated in place, keeping the link."""
+    real_conf = mock_home / "dotfiles" / "tmux.conf"
+    real_conf.parent.mkdir()
+    real_conf.write_text("set -g mouse on\n")
+    tmux_conf = mock_home / ".tmux.conf"
+    tmux_conf.symlink_to(real_conf)
+
+    assert theme_applier.apply_tmux_theme(make_theme("Linked"))
+
+    assert tmux_conf.is_symlink()
+    assert "# Theme: Linked" in real_conf.read_text()
+
+
+def test_reapplying_same_theme_skips_backup(mock_home: Path) -> None:
+    """Test that reapplying the current theme leaves the config untouched."""
+    theme_applier = ThemeApplier(backup_enabled=True)
+    tmux_conf = mock_home / ".tmux.conf"
+    tmux_conf.write_text("set -g mouse on\n")
+
+    assert theme_applier.apply_tmux_theme(make_theme("First"))
+    files_after_first = sorted(mock_home.iterdir())
+    mtime = tmux_conf.stat().st_mtime_ns
+
+    assert theme_applier.apply_tmux_theme(make_theme("First"))
+
+    assert sorted(mock_home.iterdir()) == files_after_first
+    assert tmux_conf.stat().st_mtime_ns == mtime
@@ -1,15 +1,17 @@
 """Tests for theme manager."""
 
+import os
+from collections.abc import Mapping
 from pathlib import Path
 import pytest
 
-from environment_configurator.tmux.theme_manager import ThemeManager
+from environment_configurator.tmux.theme_manager import _YAML_CACHE, ThemeManager
 from environment_configurator.tmux.models import Theme
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def theme_manager() -> ThemeManager:
-    """Create a theme manager instance."""
+    """Create a theme manager instance, shared by the module's read-only tests."""
     return ThemeManager()
 
 
@@ -68,7 +70,7 @@ def test_search_themes_no_results(theme_manager: ThemeManager) -> None:
 def test_get_grouped_themes(theme_manager: ThemeManager) -> None:
     """Test getting grouped themes."""
     grouped = theme_manager.get_grouped_themes()
-    assert isinstance(grouped, dict)
+    assert isinstance(grouped, Mapping)
     assert len(grouped) > 0
 
 
@@ -104,3 +106,33 @@ def test_theme_model() -> None:
     theme_dict = theme.to_dict()
     assert theme_dict["name"] == "Test Theme"
     assert theme_dict["bg_color"] == "#000000"
+
+    # Test from_dict round trip
+    assert Theme.from_dict(theme_dict) == theme
+
+
+def test_themes_file_reloaded_when_changed(temp_dir: Path) -> None:
+    """Test that a changed themes file is parsed again rather than served from cache."""
+    themes_file = temp_dir / "themes.yaml"
+    themes_file.write_text("categories: []\nthemes: []\n")
+    assert ThemeManager(themes_file).get_theme_count() == 0
+
+    original = ThemeManager().themes_file.read_text(encoding="utf-8")
+    themes_file.write_text(original, encoding="utf-8")
+    assert ThemeManager(themes_file).get_theme_count() > 0
+
+
+def test_themes_loaded_from_json_sidecar(temp_dir: Path) -> None:
+    """Test that a JSON copy is written next to the themes file and preferred while fresh."""
+    themes_file = temp_dir / "themes.yaml"
+    themes_file.write_text(ThemeManager().themes_file.read_text(encoding="utf-8"), encoding="utf-8")
+    count = ThemeManager(themes_file).get_theme_count()
+
+    sidecar = temp_dir / "themes.yaml.json"
+    assert sidecar.exists()
+
+    # Served from the sidecar once the in-process cache is gone
+    _YAML_CACHE.clear()
+    themes_file.write_text("{not yaml", encoding="utf-8")
+    os.utime(themes_file, ns=(0, 0))
+    assert ThemeManager(themes_file).get_theme_count() == count
@@ -32,6 +32,29 @@ def test_backup_file(temp_file: Path, temp_dir: Path) -> None:
     assert backup_path.read_text() == temp_file.read_text()
 
 
+def test_backup_file_link(temp_file: Path, temp_dir: Path) -> None:
+    """Test that a linked backup keeps the old contents once the file is replaced."""
+    backup_path = backup_file(temp_file, backup_dir=temp_dir, timestamp=False, link=True)
+
+    assert backup_path is not None
+    replacement = temp_dir / "replacement.txt"
+    replacement.write_text("new content\n")
+    replacement.replace(temp_file)
+
+    assert backup_path.read_text() == "test content\n"
+
+
+def test_backup_file_timestamps_unique(temp_file: Path, temp_dir: Path) -> None:
+    """Test that backups taken in quick succession don't overwrite each other."""
+    first = backup_file(temp_file, backup_dir=temp_dir)
+    temp_file.write_text("changed content\n")
+    second = backup_file(temp_file, backup_dir=temp_dir)
+
+    assert first != second
+    assert first.read_text() == "test content\n"
+    assert second.read_text() == "changed content\n"
+
+
 def test_backup_nonexistent_file(temp_dir: Path) -> None:
     """Test backup of nonexistent file."""
     nonexistent = temp_dir / "nonexistent.txt"
@@ -64,6 +87,24 @@ def test_safe_write_file_with_backup(temp_file: Path) -> None:
     assert len(backups) >= 1
 
 
+def test_safe_write_file_through_symlink(temp_file: Path, temp_dir: Path) -> None:
+    """Test that writing a symlinked file keeps the link and a separate backup."""
+    link_path = temp_dir / "link.txt"
+    link_path.symlink_to(temp_file)
+
+    safe_write_file(link_path, "new content\n", backup=True)
+
+    assert link_path.is_symlink()
+    assert temp_file.read_text() == "new content\n"
+
+    with open(temp_file, "a") as f:
+        f.write("edited\n")
+
+    backups = list(temp_dir.glob("link.txt.backup.*"))
+    assert len(backups) == 1
+    assert backups[0].read_text() == "test content\n"
+
+
 def test_create_symlink(temp_file: Path, temp_dir: Path) -> None:
     """Test symlink creation."""
     link_path = temp_dir / "link.txt"
@@ -90,6 +131,13 @@ def test_read_file(temp_file: Path) -> None:
     assert content == "test content\n"
 
 
+def test_read_file_sees_changes(temp_file: Path) -> None:
+    """Test that a changed file is read again rather than served from cache."""
+    assert read_file(temp_file) == "test content\n"
+    temp_file.write_text("changed content\n")
+    assert read_file(temp_file) == "changed content\n"
+
+
 def test_read_nonexistent_file(temp_dir: Path) -> None:
     """Test reading nonexistent file."""
     with pytest.raises(FileNotFoundError):